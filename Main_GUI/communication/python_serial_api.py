@@ -1,8 +1,17 @@
-import serial
-import serial.tools.list_ports
 import threading
 import time
-import asyncio
+import struct
+import logging
+
+import numpy as np
+
+# pyserial and asyncio are imported where they are used: constructing the API
+# (which every GUI does at startup) should not pay for them up front.
+
+log = logging.getLogger(__name__)
+
+# One command on the wire: group/start byte, address byte, duty/freq byte
+_CMD = struct.Struct("3B")
 
 class python_serial_api:
     def __init__(self):  # Fixed: was _init_ instead of __init__
@@ -12,34 +21,42 @@ class python_serial_api:
 
     async def send_command_async(self, addr, duty, freq, start_or_stop):
         """Asynchronous method to send a command to the serial device"""
+        import asyncio
         start_time = time.time()
         if self.send_command(addr, duty, freq, start_or_stop):
-            print(f'Command sent asynchronously to #{addr} with duty {duty} and freq {freq}, start_or_stop {start_or_stop}')
+            log.debug('Command sent asynchronously to #%s with duty %s and freq %s, start_or_stop %s', addr, duty, freq, start_or_stop)
         else:
-            print(f'Failed to send command asynchronously to #{addr} with duty {duty} and freq {freq}')
+            log.warning('Failed to send command asynchronously to #%s with duty %s and freq %s', addr, duty, freq)
 
         # Wait until it receives a message
         while True:
             if self.serial_connection is None or not self.connected:
-                print('Serial connection is not established.')
+                log.warning('Serial connection is not established.')
                 return False
             try:
                 response = self.serial_connection.readline()
                 response = response.decode('utf-8').strip()
                 if response:
-                    print(f'Received response: {response}')
+                    log.debug('Received response: %s', response)
                     break
             except Exception as e:
-                print(f'Error reading from serial: {e}')
+                log.warning('Error reading from serial: %s', e)
             await asyncio.sleep(0.001)
 
-    def create_command(self, addr, duty, freq, start_or_stop):
+    @staticmethod
+    def _pack_command(buf, offset, addr, duty, freq, start_or_stop):
+        """Write the 3 command bytes for one actuator into `buf` at `offset`."""
         serial_group = addr // 16
         serial_addr = addr % 16
         byte1 = (serial_group << 2) | (start_or_stop & 0x01)
         byte2 = 0x40 | (serial_addr & 0x3F)  # 0x40 represents the leading '01'
         byte3 = 0x80 | ((duty & 0x0F) << 3) | (freq & 0x07)  # 0x80 represents the leading '1'
-        return bytearray([byte1, byte2, byte3])
+        _CMD.pack_into(buf, offset, byte1, byte2, byte3)
+
+    def create_command(self, addr, duty, freq, start_or_stop):
+        command = bytearray(_CMD.size)
+        self._pack_command(command, 0, addr, duty, freq, start_or_stop)
+        return command
 
     def send_command(self, addr, duty, freq, start_or_stop) -> bool:
         if self.serial_connection is None or not self.connected:
@@ -50,42 +67,103 @@ class python_serial_api:
         #command = command + bytearray([0xFF, 0xFF, 0xFF]) * 19  # Padding
         try:
             self.serial_connection.write(command)
-            print(f'Serial sent command to #{addr} with duty {duty} and freq {freq}, start_or_stop {start_or_stop}')
+            log.debug('Serial sent command to #%s with duty %s and freq %s, start_or_stop %s', addr, duty, freq, start_or_stop)
             return True
         except Exception as e:
-            print(f'Serial failed to send command to #{addr} with duty {duty} and freq {freq}. Error: {e}')
+            log.warning('Serial failed to send command to #%s with duty %s and freq %s. Error: %s', addr, duty, freq, e)
             return False
 
     def send_command_list(self, commands) -> bool:
         if self.serial_connection is None or not self.connected:
             return False
-        command = bytearray()
-        for c in commands:
+        # padding to 60 bytes: unused slots stay 0xFF
+        command = bytearray(b'\xff' * (_CMD.size * max(20, len(commands))))
+        for i, c in enumerate(commands):
             addr = c.get('addr', -1)
             duty = c.get('duty', -1)
             freq = c.get('freq', -1)
             start_or_stop = c.get('start_or_stop', -1)
             if addr < 0 or addr > 127 or duty < 0 or duty > 15 or freq < 0 or freq > 7 or start_or_stop not in [0, 1]:
                 return False
-            command = command + self.create_command(int(addr), int(duty), int(freq), int(start_or_stop))
-        # padding to 60 bytes
-        command = command + bytearray([0xFF, 0xFF, 0xFF]) * (20 - len(commands))
+            self._pack_command(command, i * _CMD.size, int(addr), int(duty), int(freq), int(start_or_stop))
         try:
             self.serial_connection.write(command)
-            print(f'Serial sent command list {commands}')
+            log.debug('Serial sent command list %s', commands)
             return True
         except Exception as e:
-            print(f'Serial failed to send command list {commands}. Error: {e}')
+            log.warning('Serial failed to send command list %s. Error: %s', commands, e)
+            return False
+
+    def send_batch(self, commands) -> bool:
+        """Send (addr, duty, freq, start_or_stop) tuples in a single serial write.
+
+        The bytes are the same stream that one send_command() per tuple would
+        produce, so the device sees no difference; invalid entries are skipped.
+        """
+        if self.serial_connection is None or not self.connected:
+            return False
+        commands = list(commands)
+        buf = bytearray(_CMD.size * len(commands))
+        n = 0
+        ok = True
+        for addr, duty, freq, start_or_stop in commands:
+            if addr < 0 or addr > 127 or duty < 0 or duty > 15 or freq < 0 or freq > 7 or start_or_stop not in (0, 1):
+                ok = False
+                continue
+            self._pack_command(buf, n * _CMD.size, int(addr), int(duty), int(freq), int(start_or_stop))
+            n += 1
+        del buf[n * _CMD.size:]
+        if not buf:
+            return ok
+        try:
+            self.serial_connection.write(buf)
+            log.debug('Serial sent batch of %d commands', len(buf) // 3)
+            return ok
+        except Exception as e:
+            log.warning('Serial failed to send batch of %d commands. Error: %s', len(buf) // 3, e)
+            return False
+
+    def send_uniform(self, addrs, duty, freq, start_or_stop) -> bool:
+        """Send the same duty/freq to every address in `addrs` in a single serial write.
+
+        The command bytes are built for all addresses at once with numpy, so
+        `addrs` is best passed as an integer array the caller keeps around.
+        Out-of-range addresses are skipped.
+        """
+        if self.serial_connection is None or not self.connected:
+            return False
+        if duty < 0 or duty > 15 or freq < 0 or freq > 7 or start_or_stop not in (0, 1):
+            return False
+        addrs = np.asarray(addrs, dtype=np.int64)
+        valid = (addrs >= 0) & (addrs <= 127)
+        if not valid.all():
+            addrs = addrs[valid]
+        # Same layout as create_command, one row per address
+        buf = np.empty((len(addrs), 3), dtype=np.uint8)
+        buf[:, 0] = ((addrs // 16) << 2) | (int(start_or_stop) & 0x01)
+        buf[:, 1] = 0x40 | (addrs % 16)
+        buf[:, 2] = 0x80 | ((int(duty) & 0x0F) << 3) | (int(freq) & 0x07)
+        if not len(buf):
+            return bool(valid.all())
+        try:
+            self.serial_connection.write(buf.tobytes())
+            log.debug('Serial sent duty %s freq %s to %d actuators', duty, freq, len(buf))
+            return bool(valid.all())
+        except Exception as e:
+            log.warning('Serial failed to send duty %s freq %s to %d actuators. Error: %s', duty, freq, len(buf), e)
             return False
 
     def get_serial_devices(self):
         """Get a list of available serial ports"""
+        import serial.tools.list_ports
         ports = serial.tools.list_ports.comports()
         return [f"{port.device} - {port.description}" for port in ports]
 
     def connect_serial_device(self, port_info) -> bool:
         """Connect to a serial device using port information"""
         try:
+            import serial
+            
             # Extract port name from the port_info string
             port_name = port_info.split(' - ')[0]
             
@@ -102,13 +180,13 @@ class python_serial_api:
             
             if self.serial_connection.is_open:
                 self.connected = True
-                print(f'Serial connected to {port_name}')
+                log.info('Serial connected to %s', port_name)
                 return True
             else:
                 return False
                 
         except Exception as e:
-            print(f'Serial failed to connect to {port_info}. Error: {e}')
+            log.warning('Serial failed to connect to %s. Error: %s', port_info, e)
             self.serial_connection = None
             self.connected = False
             return False
@@ -120,10 +198,10 @@ class python_serial_api:
                 self.serial_connection.close()
                 self.connected = False
                 self.serial_connection = None
-                print('Serial disconnected')
+                log.info('Serial disconnected')
                 return True
         except Exception as e:
-            print(f'Serial failed to disconnect. Error: {e}')
+            log.warning('Serial failed to disconnect. Error: %s', e)
         return False
 
     # Legacy method names for compatibility with existing code
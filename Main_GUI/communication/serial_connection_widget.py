@@ -13,6 +13,12 @@ import os
 # Import your serial API
 from python_serial_api import python_serial_api
 
+# Status row styles, parsed by Qt only when the connection state flips
+_INDICATOR_CONNECTED_QSS = "color: #4CAF50; font-size: 16px; font-weight: bold;"
+_INDICATOR_DISCONNECTED_QSS = "color: #f44336; font-size: 16px; font-weight: bold;"
+_STATUS_TEXT_CONNECTED_QSS = "color: #4CAF50; font-size: 12px; margin-left: 5px; margin-right: 10px;"
+_STATUS_TEXT_DISCONNECTED_QSS = "color: #666; font-size: 12px; margin-left: 5px; margin-right: 10px;"
+
 class DeviceSelectionDialog(QDialog):
     """Dialog for selecting a USB serial device"""
     
@@ -81,56 +87,37 @@ class DeviceSelectionDialog(QDialog):
         info_label.setStyleSheet("color: #666; font-size: 11px; margin: 5px 0px;")
         layout.addWidget(info_label)
         
-        # Buttons
+        # Buttons (styled once via the dialog stylesheet below)
         button_box = QDialogButtonBox()
         
         if self.devices:
             self.connect_btn = QPushButton("Connect")
-            self.connect_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    font-weight: bold;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 8px 20px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-            """)
+            self.connect_btn.setObjectName("connectBtn")
             button_box.addButton(self.connect_btn, QDialogButtonBox.ButtonRole.AcceptRole)
         
         self.refresh_btn = QPushButton("Refresh")
-        self.refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 20px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
+        self.refresh_btn.setObjectName("refreshBtn")
         button_box.addButton(self.refresh_btn, QDialogButtonBox.ButtonRole.ActionRole)
         
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet("""
+        cancel_btn.setObjectName("cancelBtn")
+        button_box.addButton(cancel_btn, QDialogButtonBox.ButtonRole.RejectRole)
+        
+        self.setStyleSheet("""
             QPushButton {
-                background-color: #666;
                 color: white;
+                font-weight: bold;
                 border: none;
                 border-radius: 4px;
                 padding: 8px 20px;
             }
-            QPushButton:hover {
-                background-color: #555;
-            }
+            QPushButton#connectBtn { background-color: #4CAF50; }
+            QPushButton#connectBtn:hover { background-color: #45a049; }
+            QPushButton#refreshBtn { background-color: #2196F3; }
+            QPushButton#refreshBtn:hover { background-color: #1976D2; }
+            QPushButton#cancelBtn { background-color: #666; font-weight: normal; }
+            QPushButton#cancelBtn:hover { background-color: #555; }
         """)
-        button_box.addButton(cancel_btn, QDialogButtonBox.ButtonRole.RejectRole)
         
         layout.addWidget(button_box)
         
@@ -165,6 +152,7 @@ class SerialConnectionWidget(QWidget):
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.refresh_devices)
         self.current_device = None
+        self._last_connected = False  # matches the styles built in init_ui
         
         self.init_ui()
         self.setup_styles()
@@ -193,35 +181,21 @@ class SerialConnectionWidget(QWidget):
         
         # Connection status indicator
         self.status_indicator = QLabel("●")
-        self.status_indicator.setStyleSheet("color: #f44336; font-size: 16px; font-weight: bold;")
+        self.status_indicator.setStyleSheet(_INDICATOR_DISCONNECTED_QSS)
         self.status_indicator.setToolTip("Connection Status")
         bottom_layout.addWidget(self.status_indicator)
         
         # Status text
         self.status_text = QLabel("Disconnected")
-        self.status_text.setStyleSheet("color: #666; font-size: 12px; margin-left: 5px; margin-right: 10px;")
+        self.status_text.setStyleSheet(_STATUS_TEXT_DISCONNECTED_QSS)
         bottom_layout.addWidget(self.status_text)
         
         # Single connect/disconnect button
         self.connection_btn = QPushButton("Connect USB Device")
         self.connection_btn.clicked.connect(self.toggle_connection)
         self.connection_btn.setMinimumSize(140, 35)
-        self.connection_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        self.connection_btn.setObjectName("connectionBtn")
+        self.connection_btn.setProperty("connected", False)
         bottom_layout.addWidget(self.connection_btn)
         
         parent_layout.addLayout(bottom_layout)
@@ -235,11 +209,24 @@ class SerialConnectionWidget(QWidget):
         pass
     
     def setup_styles(self):
-        # Set minimal widget style
+        # Set minimal widget style; the connection button switches colors via its "connected" property
         self.setStyleSheet("""
             QWidget {
                 background-color: transparent;
             }
+            QPushButton#connectionBtn {
+                background-color: #4CAF50;
+                color: white;
+                font-weight: bold;
+                border: none;
+                border-radius: 6px;
+                padding: 8px 16px;
+            }
+            QPushButton#connectionBtn:hover { background-color: #45a049; }
+            QPushButton#connectionBtn:pressed { background-color: #3d8b40; }
+            QPushButton#connectionBtn[connected="true"] { background-color: #f44336; }
+            QPushButton#connectionBtn[connected="true"]:hover { background-color: #da190b; }
+            QPushButton#connectionBtn[connected="true"]:pressed { background-color: #c1170a; }
         """)
     
     def refresh_devices(self):
@@ -336,52 +323,37 @@ class SerialConnectionWidget(QWidget):
     
     def update_connection_status(self, connected):
         """Update UI elements based on connection status"""
-        if connected:
-            self.status_indicator.setStyleSheet("color: #4CAF50; font-size: 16px; font-weight: bold;")
-            self.status_text.setText("Connected")
-            self.status_text.setStyleSheet("color: #4CAF50; font-size: 12px; margin-left: 5px; margin-right: 10px;")
-            self.connection_btn.setText("Disconnect")
-            self.connection_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f44336;
-                    color: white;
-                    font-weight: bold;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                }
-                QPushButton:hover {
-                    background-color: #da190b;
-                }
-                QPushButton:pressed {
-                    background-color: #c1170a;
-                }
-            """)
-            # Update tooltip
-            device_name = self.current_device.split(' - ')[0] if self.current_device else "Unknown"
-            self.status_indicator.setToolTip(f"Connected to {device_name}")
-        else:
-            self.status_indicator.setStyleSheet("color: #f44336; font-size: 16px; font-weight: bold;")
-            self.status_text.setText("Disconnected")
-            self.status_text.setStyleSheet("color: #666; font-size: 12px; margin-left: 5px; margin-right: 10px;")
-            self.connection_btn.setText("Connect USB Device")
-            self.connection_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    font-weight: bold;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-                QPushButton:pressed {
-                    background-color: #3d8b40;
-                }
-            """)
-            self.status_indicator.setToolTip("No device connected")
+        connected = bool(connected)
+        # Apply the whole status row in a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Restyle only when the state flips; repeated calls keep the parsed styles
+            if connected != self._last_connected:
+                self._last_connected = connected
+                if connected:
+                    self.status_indicator.setStyleSheet(_INDICATOR_CONNECTED_QSS)
+                    self.status_text.setText("Connected")
+                    self.status_text.setStyleSheet(_STATUS_TEXT_CONNECTED_QSS)
+                    self.connection_btn.setText("Disconnect")
+                else:
+                    self.status_indicator.setStyleSheet(_INDICATOR_DISCONNECTED_QSS)
+                    self.status_text.setText("Disconnected")
+                    self.status_text.setStyleSheet(_STATUS_TEXT_DISCONNECTED_QSS)
+                    self.connection_btn.setText("Connect USB Device")
+            
+                # Re-resolve the widget stylesheet against the new property value
+                self.connection_btn.setProperty("connected", connected)
+                self.connection_btn.style().unpolish(self.connection_btn)
+                self.connection_btn.style().polish(self.connection_btn)
+        
+            # Update tooltip (the device can change between calls)
+            if connected:
+                device_name = self.current_device.split(' - ')[0] if self.current_device else "Unknown"
+                self.status_indicator.setToolTip(f"Connected to {device_name}")
+            else:
+                self.status_indicator.setToolTip("No device connected")
+        finally:
+            self.setUpdatesEnabled(True)
         
         self.connection_status_changed.emit(connected)
     
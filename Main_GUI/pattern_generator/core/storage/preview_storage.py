@@ -4,6 +4,9 @@ from ..phantom_engine import PreviewBundle
 
 PREVIEWS_DIR = "saved_previews"
 
+# list_bundles() result, keyed on the directory mtime
+_list_cache = {"mtime": None, "items": []}
+
 def ensure_dir():
     if not os.path.exists(PREVIEWS_DIR):
         os.makedirs(PREVIEWS_DIR)
@@ -12,16 +15,33 @@ def save_bundle(bundle: PreviewBundle) -> str:
     ensure_dir()
     safe = bundle.name.replace(" ", "_")
     path = os.path.join(PREVIEWS_DIR, f"{safe}.json")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(bundle.to_json())
+    data = bundle.to_json().encode("utf-8")
+    # Leave the file alone if it already holds exactly these bytes
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return path
+    except FileNotFoundError:
+        pass
+    # Write next to the target and swap in, so a killed process never leaves half a file
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
     return path
 
 def load_bundle(path: str) -> Optional[PreviewBundle]:
-    if not os.path.exists(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return PreviewBundle.from_json(f.read())
+    except FileNotFoundError:
         return None
-    with open(path, "r", encoding="utf-8") as f:
-        return PreviewBundle.from_json(f.read())
 
 def list_bundles() -> list[str]:
     ensure_dir()
-    return sorted([f for f in os.listdir(PREVIEWS_DIR) if f.endswith(".json")])
\ No newline at end of file
+    mtime = os.stat(PREVIEWS_DIR).st_mtime_ns
+    if mtime != _list_cache["mtime"]:
+        with os.scandir(PREVIEWS_DIR) as it:
+            items = sorted(e.name for e in it if e.name.endswith(".json"))
+        _list_cache.update(mtime=mtime, items=items)
+    return list(_list_cache["items"])
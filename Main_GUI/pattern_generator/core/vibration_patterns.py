@@ -2,6 +2,12 @@
 import time
 import math
 import random
+import itertools
+import threading
+
+import numpy as np
+
+MAX_ACTUATORS = 128  # serial protocol addresses 0-127
 
 class VibrationPattern:
     """Base class for all vibration patterns"""
@@ -9,34 +15,119 @@ class VibrationPattern:
         self.name = name
         self.description = description
         self.api = None
-        self.stop_flag = False
-        self.active_actuators = set()
+        self._stop_event = threading.Event()
+        self._active = bytearray(MAX_ACTUATORS // 8)  # one bit per actuator address
+    
+    @property
+    def stop_flag(self):
+        return self._stop_event.is_set()
+    
+    @stop_flag.setter
+    def stop_flag(self, value):
+        if value:
+            self._stop_event.set()
+        else:
+            self._stop_event.clear()
+    
+    @property
+    def active_actuators(self):
+        """Addresses this pattern has started and not yet stopped."""
+        return set(self._iter_active())
+    
+    def _iter_active(self):
+        for i, bits in enumerate(self._active):
+            if bits:
+                for j in range(8):
+                    if bits & (1 << j):
+                        yield (i << 3) | j
+    
+    def _mark_active(self, addr):
+        if 0 <= addr < MAX_ACTUATORS:
+            self._active[addr >> 3] |= 1 << (addr & 7)
+    
+    def _mark_inactive(self, addr):
+        if 0 <= addr < MAX_ACTUATORS:
+            self._active[addr >> 3] &= ~(1 << (addr & 7))
+    
+    def _clear_active(self):
+        self._active[:] = bytes(len(self._active))
     
     def set_api(self, api):
         self.api = api
     
     def stop(self):
-        self.stop_flag = True
+        self._stop_event.set()
         self.stop_all_active_actuators()
     
+    def _sleep(self, seconds):
+        """Wait up to `seconds`, waking immediately on stop(). Returns True if stopped."""
+        return self._stop_event.wait(seconds)
+    
+    def _sleep_step(self, start_time, duration, step):
+        """Sleep one step, clipped to `duration` measured from `start_time` (perf_counter).
+        Returns True once the pattern is stopped or its time is up."""
+        remaining = duration - (time.perf_counter() - start_time)
+        if remaining <= 0 or self._sleep(min(step, remaining)):
+            return True
+        # Measured after the wait, so the answer doesn't hinge on float rounding of step vs remaining
+        return time.perf_counter() - start_time >= duration
+    
+    def _run_frames(self, duration, step):
+        """Yield tick indices until `duration` elapses or the pattern is stopped.
+        The caller acts on each tick; `step` is a delay in seconds or an iterable of delays.
+        A scalar step yields at most ceil(duration / step) ticks, however early a wait wakes."""
+        if isinstance(step, (int, float)):
+            if step > 0:
+                # The epsilon keeps e.g. 6 * (0.5 / 6) / (0.5 / 6) = 6.000000000000001 at 6 ticks
+                steps = itertools.repeat(step, max(1, math.ceil(duration / step - 1e-9)))
+            else:
+                steps = itertools.repeat(step)
+        else:
+            steps = step
+        start_time = time.perf_counter()
+        for tick, delay in enumerate(steps):
+            if self._stop_event.is_set():
+                return
+            yield tick
+            if self._sleep_step(start_time, duration, delay):
+                return
+    
     def stop_all_active_actuators(self):
         if self.api:
-            for addr in self.active_actuators:
-                self.api.send_command(addr, 0, 0, 0)
-            self.active_actuators.clear()
+            if any(self._active):
+                self.api.send_batch([(addr, 0, 0, 0) for addr in self._iter_active()])
+            self._clear_active()
     
     def start_actuator(self, addr, intensity, frequency):
         if self.api:
-            self.active_actuators.add(addr)
+            self._mark_active(addr)
             return self.api.send_command(addr, intensity, frequency, 1)
         return False
     
     def stop_actuator(self, addr):
         if self.api:
-            self.active_actuators.discard(addr)
+            self._mark_inactive(addr)
             return self.api.send_command(addr, 0, 0, 0)
         return False
     
+    def start_actuators(self, addrs, intensity, frequency):
+        """Start several actuators with one serial write."""
+        if self.api:
+            addrs = list(addrs)
+            for addr in addrs:
+                self._mark_active(addr)
+            return self.api.send_batch([(addr, intensity, frequency, 1) for addr in addrs])
+        return False
+    
+    def stop_actuators(self, addrs):
+        """Stop several actuators with one serial write."""
+        if self.api:
+            addrs = list(addrs)
+            for addr in addrs:
+                self._mark_inactive(addr)
+            return self.api.send_batch([(addr, 0, 0, 0) for addr in addrs])
+        return False
+    
     def execute(self, **kwargs):
         raise NotImplementedError
 
@@ -48,13 +139,10 @@ class SinglePulsePattern(VibrationPattern):
         if not self.api:
             return False
         
-        self.active_actuators.clear()
-        for addr in actuators:
-            self.start_actuator(addr, intensity, frequency)
+        self._clear_active()
+        self.start_actuators(actuators, intensity, frequency)
         
-        start_time = time.time()
-        while time.time() - start_time < duration and not self.stop_flag:
-            time.sleep(0.1)
+        self._sleep(duration)
         
         self.stop_all_active_actuators()
         return True
@@ -67,25 +155,21 @@ class WavePattern(VibrationPattern):
         if not self.api:
             return False
         
-        self.active_actuators.clear()
+        self._clear_active()
         actuators = sorted(actuators)
-        step_duration = wave_speed / len(actuators) if actuators else 0.1
-        total_time = 0
+        if not actuators:
+            return True
+        step_duration = wave_speed / len(actuators)
         
-        while total_time < duration and not self.stop_flag:
-            for i, addr in enumerate(actuators):
-                if self.stop_flag:
-                    break
-                
-                self.start_actuator(addr, intensity, frequency)
-                if i > 0:
-                    self.stop_actuator(actuators[i-1])
-                
-                time.sleep(step_duration)
-                total_time += step_duration
-                
-                if total_time >= duration:
-                    break
+        for tick in self._run_frames(duration, step_duration):
+            i = tick % len(actuators)
+            # Start this node and stop the previous one in the same write
+            commands = [(actuators[i], intensity, frequency, 1)]
+            self._mark_active(actuators[i])
+            if i > 0:
+                commands.append((actuators[i-1], 0, 0, 0))
+                self._mark_inactive(actuators[i-1])
+            self.api.send_batch(commands)
         
         self.stop_all_active_actuators()
         return True
@@ -98,30 +182,14 @@ class PulseTrainPattern(VibrationPattern):
         if not self.api:
             return False
         
-        self.active_actuators.clear()
-        total_time = 0
+        self._clear_active()
         
-        while total_time < duration and not self.stop_flag:
-            # Turn on
-            for addr in actuators:
-                self.start_actuator(addr, intensity, frequency)
-            
-            start_time = time.time()
-            while time.time() - start_time < pulse_on and not self.stop_flag:
-                time.sleep(0.01)
-            total_time += pulse_on
-            
-            if total_time >= duration or self.stop_flag:
-                break
-            
-            # Turn off
-            for addr in actuators:
-                self.stop_actuator(addr)
-            
-            start_time = time.time()
-            while time.time() - start_time < pulse_off and not self.stop_flag:
-                time.sleep(0.01)
-            total_time += pulse_off
+        # Even ticks turn on for pulse_on, odd ticks turn off for pulse_off
+        for tick in self._run_frames(duration, itertools.cycle((pulse_on, pulse_off))):
+            if tick % 2 == 0:
+                self.start_actuators(actuators, intensity, frequency)
+            else:
+                self.stop_actuators(actuators)
         
         self.stop_all_active_actuators()
         return True
@@ -134,40 +202,22 @@ class FadePattern(VibrationPattern):
         if not self.api:
             return False
         
-        self.active_actuators.clear()
+        self._clear_active()
         fade_duration = duration / (2 * fade_steps)
+        # Fade in over steps 0..fade_steps, then back out from fade_steps to 0
+        ramp = [int(k * max_intensity / fade_steps) for k in range(fade_steps + 1)]
+        levels = ramp + ramp[::-1]
+        last_intensity = None
         
-        # Fade in
-        for step in range(fade_steps + 1):
-            if self.stop_flag:
-                break
-            
-            intensity = int((step / fade_steps) * max_intensity)
-            for addr in actuators:
-                if intensity > 0:
-                    self.start_actuator(addr, intensity, frequency)
-                else:
-                    self.stop_actuator(addr)
-            
-            start_time = time.time()
-            while time.time() - start_time < fade_duration and not self.stop_flag:
-                time.sleep(0.01)
-        
-        # Fade out
-        for step in range(fade_steps, -1, -1):
-            if self.stop_flag:
-                break
-            
-            intensity = int((step / fade_steps) * max_intensity)
-            for addr in actuators:
+        # Driven by the table: a stray extra tick can never index past its end
+        for intensity, _ in zip(levels, self._run_frames(len(levels) * fade_duration, fade_duration)):
+            # Actuators hold their last command: only write when the level changes
+            if intensity != last_intensity:
                 if intensity > 0:
-                    self.start_actuator(addr, intensity, frequency)
+                    self.start_actuators(actuators, intensity, frequency)
                 else:
-                    self.stop_actuator(addr)
-            
-            start_time = time.time()
-            while time.time() - start_time < fade_duration and not self.stop_flag:
-                time.sleep(0.01)
+                    self.stop_actuators(actuators)
+                last_intensity = intensity
         
         self.stop_all_active_actuators()
         return True
@@ -180,38 +230,28 @@ class CircularPattern(VibrationPattern):
         if not self.api:
             return False
         
-        self.active_actuators.clear()
+        self._clear_active()
         actuators = sorted(actuators)
         if len(actuators) < 2:
             return self._single_pulse_fallback(actuators, intensity, frequency, duration)
         
         step_duration = rotation_speed / len(actuators)
-        total_time = 0
-        current_index = 0
         
-        while total_time < duration and not self.stop_flag:
-            for addr in actuators:
-                self.stop_actuator(addr)
-            
-            self.start_actuator(actuators[current_index], intensity, frequency)
-            
-            start_time = time.time()
-            while time.time() - start_time < step_duration and not self.stop_flag:
-                time.sleep(0.01)
-            
-            total_time += step_duration
-            current_index = (current_index + 1) % len(actuators)
+        for tick in self._run_frames(duration, step_duration):
+            # Stop the ring and start the next node in the same write
+            current = actuators[tick % len(actuators)]
+            self._clear_active()
+            self._mark_active(current)
+            self.api.send_batch([(addr, 0, 0, 0) for addr in actuators if addr != current]
+                                + [(current, intensity, frequency, 1)])
         
         self.stop_all_active_actuators()
         return True
     
     def _single_pulse_fallback(self, actuators, intensity, frequency, duration):
-        for addr in actuators:
-            self.start_actuator(addr, intensity, frequency)
+        self.start_actuators(actuators, intensity, frequency)
         
-        start_time = time.time()
-        while time.time() - start_time < duration and not self.stop_flag:
-            time.sleep(0.1)
+        self._sleep(duration)
         
         self.stop_all_active_actuators()
         return True
@@ -224,24 +264,19 @@ class RandomPattern(VibrationPattern):
         if not self.api:
             return False
         
-        self.active_actuators.clear()
-        total_time = 0
+        self._clear_active()
+        rng = random.Random()
+        pool = list(actuators)
+        max_active = max(1, len(pool) // 2)
         
-        while total_time < duration and not self.stop_flag:
-            for addr in actuators:
-                self.stop_actuator(addr)
-            
-            num_active = random.randint(1, max(1, len(actuators) // 2))
-            active_actuators = random.sample(actuators, num_active)
-            
-            for addr in active_actuators:
-                self.start_actuator(addr, intensity, frequency)
+        for _ in self._run_frames(duration, change_interval):
+            self.stop_actuators(pool)
             
-            start_time = time.time()
-            while time.time() - start_time < change_interval and not self.stop_flag:
-                time.sleep(0.01)
+            # Shuffle the pool in place and take a prefix instead of sampling a new list
+            num_active = rng.randint(1, max_active)
+            rng.shuffle(pool)
             
-            total_time += change_interval
+            self.start_actuators(pool[:num_active], intensity, frequency)
         
         self.stop_all_active_actuators()
         return True
@@ -254,21 +289,32 @@ class SineWavePattern(VibrationPattern):
         if not self.api:
             return False
         
-        self.active_actuators.clear()
-        start_time = time.time()
+        self._clear_active()
+        # Every actuator gets the same level, so each frame is one vectorized write
+        addrs = np.asarray(actuators, dtype=np.int64)
+        for addr in actuators:
+            self._mark_active(addr)
+        # One sine period quantized to 256 phase steps
+        lut = [int(max_intensity * (math.sin(2 * math.pi * k / 256) + 1) / 2) for k in range(256)]
+        phase_scale = sine_frequency * 256
+        last_intensity = None
+        start_time = time.perf_counter()
         
-        while time.time() - start_time < duration and not self.stop_flag:
-            current_time = time.time() - start_time
-            sine_value = math.sin(2 * math.pi * sine_frequency * current_time)
-            intensity = int(max_intensity * (sine_value + 1) / 2)
+        while not self.stop_flag:
+            current_time = time.perf_counter() - start_time
+            if current_time >= duration:
+                break
+            intensity = lut[int(current_time * phase_scale) & 255]
             
-            for addr in actuators:
+            # Actuators hold their last command: only write when the level changes
+            if intensity != last_intensity:
                 if intensity > 0:
-                    self.start_actuator(addr, intensity, frequency)
+                    self.api.send_uniform(addrs, intensity, frequency, 1)
                 else:
-                    self.stop_actuator(addr)
+                    self.api.send_uniform(addrs, 0, 0, 0)
+                last_intensity = intensity
             
-            time.sleep(0.05)
+            self._sleep(0.05)
         
         self.stop_all_active_actuators()
         return True
\ No newline at end of file
@@ -1,72 +1,186 @@
+import functools
+from enum import IntEnum
+from types import MappingProxyType
+from typing import NamedTuple, Optional
 
-PATTERN_PARAMETERS = {
-    "Single Pulse": {"parameters": []},
-    "Wave": {"parameters": [
-        {"name": "wave_speed", "label": "Wave speed", "type": "float", "range": (0.1, 3.0), "step": 0.1, "default": 0.6, "suffix": " s"}
-    ]},
-    "Pulse Train": {"parameters": [
-        {"name": "pulse_on",  "label": "Pulse ON",  "type": "float", "range": (0.05, 2.0), "step": 0.05, "default": 0.2, "suffix": " s"},
-        {"name": "pulse_off", "label": "Pulse OFF", "type": "float", "range": (0.05, 2.0), "step": 0.05, "default": 0.3, "suffix": " s"},
-    ]},
-    "Fade": {"parameters": []},
-    "Circular": {"parameters": [
-        {"name": "rotation_speed", "label": "Rotation speed", "type": "float", "range": (0.1, 3.0), "step": 0.1, "default": 1.0, "suffix": " s"}
-    ]},
-    "Random": {"parameters": [
-        {"name": "change_interval", "label": "Change interval", "type": "float", "range": (0.05, 2.0), "step": 0.05, "default": 0.3, "suffix": " s"}
-    ]},
-    "Sine Wave": {"parameters": []},
+import numpy as np
+
+
+class PatternType(IntEnum):
+    """Built-in pattern kinds. Configs keep the display name; str() gives it back."""
+    SINGLE_PULSE = 0
+    WAVE = 1
+    PULSE_TRAIN = 2
+    FADE = 3
+    CIRCULAR = 4
+    RANDOM = 5
+    SINE = 6
+
+    def __str__(self) -> str:
+        return _PATTERN_TYPE_NAMES[self]
+
+    @classmethod
+    def from_name(cls, name: str) -> Optional['PatternType']:
+        """Enum member for a display name such as "Sine Wave", or None."""
+        return _PATTERN_TYPE_BY_NAME.get(name)
+
+
+_PATTERN_TYPE_NAMES = ("Single Pulse", "Wave", "Pulse Train", "Fade", "Circular", "Random", "Sine Wave")
+_PATTERN_TYPE_BY_NAME = {name: PatternType(i) for i, name in enumerate(_PATTERN_TYPE_NAMES)}
+
+
+class ParamSpec(NamedTuple):
+    """One pattern-specific parameter editor."""
+    name: str
+    label: str
+    type: str           # "float" or "int"
+    lo: float
+    hi: float
+    step: float
+    default: float
+    suffix: str = ""
+    description: str = ""
+
+
+# Catalogs are built on first use; PATTERN_PARAMETERS and PREMADE_PATTERNS
+# stay importable as module attributes through __getattr__ below.
+
+def _raw_params() -> dict:
+    return {
+        "Single Pulse": (),
+        "Wave": (
+            ParamSpec("wave_speed", "Wave speed", "float", 0.1, 3.0, 0.1, 0.6, " s"),
+        ),
+        "Pulse Train": (
+            ParamSpec("pulse_on",  "Pulse ON",  "float", 0.05, 2.0, 0.05, 0.2, " s"),
+            ParamSpec("pulse_off", "Pulse OFF", "float", 0.05, 2.0, 0.05, 0.3, " s"),
+        ),
+        "Fade": (),
+        "Circular": (
+            ParamSpec("rotation_speed", "Rotation speed", "float", 0.1, 3.0, 0.1, 1.0, " s"),
+        ),
+        "Random": (
+            ParamSpec("change_interval", "Change interval", "float", 0.05, 2.0, 0.05, 0.3, " s"),
+        ),
+        "Sine Wave": (),
     }
 
+
+@functools.cache
+def _pattern_parameters() -> MappingProxyType:
+    """Read-only: pattern name -> its parameter specs."""
+    return MappingProxyType(_raw_params())
+
+
+def pattern_params(name: str) -> tuple[ParamSpec, ...]:
+    """Parameter specs of one pattern; empty for unknown patterns."""
+    return _pattern_parameters().get(name, ())
+
+
+@functools.cache
+def _ranges(pattern: str) -> tuple[np.ndarray, np.ndarray]:
+    """(lo, hi) arrays in ParamSpec order, for clamping a whole parameter vector at once."""
+    specs = _pattern_parameters()[pattern]
+    return (np.array([p.lo for p in specs], dtype=np.float64),
+            np.array([p.hi for p in specs], dtype=np.float64))
+
+
+def clamp_params(pattern: str, values) -> np.ndarray:
+    """Clamp parameter values, given in pattern_params order, to their ranges."""
+    lo, hi = _ranges(pattern)
+    return np.clip(np.asarray(values, dtype=np.float64), lo, hi)
+
+
+def _actuator_range(n: int) -> np.ndarray:
+    """Read-only 0..n-1 actuator array, shared by every premade that uses it."""
+    arr = np.arange(n, dtype=np.int32)
+    arr.flags.writeable = False
+    return arr
+
+
 # ---- Premade Pattern catalog (templates you can expand anytime) ----
-PREMADE_PATTERNS = [
-    {
-        "name": "Trio Burst",
-        "description": "Single pulse on actuators 0–2. Good for smoke tests.",
-        "config": {
-            "pattern_type": "Single Pulse",
-            "actuators": [0, 1, 2],
-            "intensity": 9,
-            "frequency": 4,  # device freq code you want as a default
-            "specific_parameters": {},
-            # If not present in the library, we keep the currently selected waveform
-            "waveform": {"name": "Sine"}
-        }
-    },
-    {
-        "name": "3×3 Sweep",
-        "description": "Wave pattern sweeping across a 3×3 grid (0–8).",
-        "config": {
-            "pattern_type": "Wave",
-            "actuators": [0,1,2,3,4,5,6,7,8],
-            "intensity": 8,
-            "frequency": 4,
-            "specific_parameters": {"wave_speed": 0.6},
-            "waveform": {"name": "Sine"}
-        }
-    },
-    {
-        "name": "Back Ring (Circular)",
-        "description": "Circular pattern over 16 actuators (0–15).",
-        "config": {
-            "pattern_type": "Circular",
-            "actuators": list(range(16)),
-            "intensity": 7,
-            "frequency": 4,
-            "specific_parameters": {"rotation_speed": 1.0},
-            "waveform": {"name": "Sine"}
-        }
-    },
-    {
-        "name": "Pulse Train 8-Act",
-        "description": "Pulse train on 0–7 with 0.2s ON / 0.3s OFF.",
-        "config": {
-            "pattern_type": "Pulse Train",
-            "actuators": list(range(8)),
-            "intensity": 9,
-            "frequency": 4,
-            "specific_parameters": {"pulse_on": 0.2, "pulse_off": 0.3},
-            "waveform": {"name": "Sine"}
-        }
-    },
-]
\ No newline at end of file
+# A tuple so the catalog itself can't be edited at runtime; entries keep the
+# same dict shape as saved patterns, since both go through the same loaders.
+# Actuator sets are numpy arrays: convert with .tolist() at the GUI boundary.
+@functools.cache
+def premade_patterns() -> tuple[dict, ...]:
+    acts = {n: _actuator_range(n) for n in (3, 8, 9, 16)}
+    return (
+        {
+            "name": "Trio Burst",
+            "description": "Single pulse on actuators 0–2. Good for smoke tests.",
+            "config": {
+                "pattern_type": "Single Pulse",
+                "actuators": acts[3],
+                "intensity": 9,
+                "frequency": 4,  # device freq code you want as a default
+                "specific_parameters": {},
+                # If not present in the library, we keep the currently selected waveform
+                "waveform": {"name": "Sine"}
+            }
+        },
+        {
+            "name": "3×3 Sweep",
+            "description": "Wave pattern sweeping across a 3×3 grid (0–8).",
+            "config": {
+                "pattern_type": "Wave",
+                "actuators": acts[9],
+                "intensity": 8,
+                "frequency": 4,
+                "specific_parameters": {"wave_speed": 0.6},
+                "waveform": {"name": "Sine"}
+            }
+        },
+        {
+            "name": "Back Ring (Circular)",
+            "description": "Circular pattern over 16 actuators (0–15).",
+            "config": {
+                "pattern_type": "Circular",
+                "actuators": acts[16],
+                "intensity": 7,
+                "frequency": 4,
+                "specific_parameters": {"rotation_speed": 1.0},
+                "waveform": {"name": "Sine"}
+            }
+        },
+        {
+            "name": "Pulse Train 8-Act",
+            "description": "Pulse train on 0–7 with 0.2s ON / 0.3s OFF.",
+            "config": {
+                "pattern_type": "Pulse Train",
+                "actuators": acts[8],
+                "intensity": 9,
+                "frequency": 4,
+                "specific_parameters": {"pulse_on": 0.2, "pulse_off": 0.3},
+                "waveform": {"name": "Sine"}
+            }
+        },
+    )
+
+
+@functools.cache
+def _premade_flat() -> dict:
+    """(premade name, parameter) -> value, so a lookup is one hash instead of
+    walking config -> specific_parameters; the nested form stays for display."""
+    return {
+        (p["name"], key): value
+        for p in premade_patterns()
+        for key, value in p["config"]["specific_parameters"].items()
+    }
+
+
+def premade_param(name: str, key: str, default=None):
+    """Pattern-specific parameter of a premade, or `default` if it doesn't set one."""
+    return _premade_flat().get((name, key), default)
+
+
+_LAZY = {
+    "PATTERN_PARAMETERS": _pattern_parameters,
+    "PREMADE_PATTERNS": premade_patterns,
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        return _LAZY[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
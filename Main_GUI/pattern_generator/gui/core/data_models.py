@@ -1,14 +1,275 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
 
-@dataclass
+import numpy as np
+
+if TYPE_CHECKING:
+    from waveform_designer.event_designer.core.event_data_model import HapticEvent
+
+
+class ClipTable:
+    """Timeline clips stored column-wise, one array per field.
+
+    Batch passes (total duration, culling, per-actuator lookups) only touch
+    the columns they need; TimelineClip is a lightweight view onto one row.
+    Every clip also gets a stable id, since rows shift when clips are removed.
+    Waveform names are stored once in a palette and referenced by a small id.
+    """
+
+    def __init__(self, cap: int = 0):
+        cap = max(8, int(cap))
+        self._n = 0
+        self._next_id = 0
+        self._ids = np.empty(cap, dtype=np.int64)
+        self._actuator = np.empty(cap, dtype=np.int32)
+        self._start_s = np.empty(cap, dtype=np.float64)
+        self._end_s = np.empty(cap, dtype=np.float64)
+        self._wave_id = np.empty(cap, dtype=np.int16)
+        self._wave_palette: list[str] = []
+        self._wave_index: dict[str, int] = {}
+        # Object column, kept out of the numeric arrays so batch passes never load it.
+        # Row-aligned with them: only append/extend/remove/clear may change its length.
+        self.events: list[Optional['HapticEvent']] = []
+        # Derived data, rebuilt lazily after any mutation (see _invalidate)
+        self._durations: Optional[np.ndarray] = None
+        self._by_actuator: Optional[dict[int, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self._n
+
+    # Columns, trimmed to the filled rows
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids[:self._n]
+
+    @property
+    def actuator(self) -> np.ndarray:
+        return self._actuator[:self._n]
+
+    @property
+    def start_s(self) -> np.ndarray:
+        return self._start_s[:self._n]
+
+    @property
+    def end_s(self) -> np.ndarray:
+        return self._end_s[:self._n]
+
+    @property
+    def wave_id(self) -> np.ndarray:
+        return self._wave_id[:self._n]
+
+    def waveform_name(self, row: int) -> str:
+        return self._wave_palette[self._wave_id[row]]
+
+    def _grow(self):
+        cap = 2 * len(self._ids)
+        for name in ("_ids", "_actuator", "_start_s", "_end_s", "_wave_id"):
+            old = getattr(self, name)
+            new = np.empty(cap, dtype=old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, name, new)
+
+    def append(self, actuator: int, start_s: float, end_s: float,
+               waveform_name: str, event: Optional['HapticEvent']) -> int:
+        if self._n == len(self._ids):
+            self._grow()
+        row = self._n
+        self._ids[row] = self._next_id
+        self._actuator[row] = actuator
+        self._start_s[row] = start_s
+        self._end_s[row] = end_s
+        wid = self._wave_index.get(waveform_name)
+        if wid is None:
+            wid = self._wave_index[waveform_name] = len(self._wave_palette)
+            self._wave_palette.append(waveform_name)
+        self._wave_id[row] = wid
+        self.events.append(event)
+        self._next_id += 1
+        self._n += 1
+        self._invalidate()
+        return row
+
+    def extend(self, actuators, start_s: float, end_s: float,
+               waveform_name: str, event: Optional['HapticEvent']) -> np.ndarray:
+        """Append one clip per actuator over the same time span; returns the new rows."""
+        acts = np.asarray(actuators, dtype=np.int32).ravel()
+        k = len(acts)
+        while self._n + k > len(self._ids):
+            self._grow()
+        rows = np.arange(self._n, self._n + k)
+        self._ids[rows] = np.arange(self._next_id, self._next_id + k)
+        self._actuator[rows] = acts
+        self._start_s[rows] = start_s
+        self._end_s[rows] = end_s
+        wid = self._wave_index.get(waveform_name)
+        if wid is None:
+            wid = self._wave_index[waveform_name] = len(self._wave_palette)
+            self._wave_palette.append(waveform_name)
+        self._wave_id[rows] = wid
+        self.events.extend([event] * k)
+        self._next_id += k
+        self._n += k
+        self._invalidate()
+        return rows
+
+    def remove(self, row: int):
+        n = self._n
+        for col in (self._ids, self._actuator, self._start_s, self._end_s, self._wave_id):
+            col[row:n - 1] = col[row + 1:n]
+        del self.events[row]
+        self._n -= 1
+        self._invalidate()
+
+    def clear(self):
+        self._n = 0
+        self._wave_palette.clear()
+        self._wave_index.clear()
+        self.events.clear()
+        self._invalidate()
+
+    def _invalidate(self):
+        self._durations = None
+        self._by_actuator = None
+
+    def _actuator_index(self) -> dict[int, np.ndarray]:
+        """actuator -> its rows sorted by start time."""
+        if self._by_actuator is None:
+            order = np.lexsort((self.start_s, self.actuator))
+            acts, first = np.unique(self.actuator[order], return_index=True)
+            bounds = np.append(first, len(order))
+            self._by_actuator = {int(a): order[bounds[i]:bounds[i + 1]] for i, a in enumerate(acts)}
+        return self._by_actuator
+
+    def copy(self) -> 'ClipTable':
+        out = ClipTable(self._n)
+        out._n = self._n
+        out._next_id = self._next_id
+        for name in ("_ids", "_actuator", "_start_s", "_end_s", "_wave_id"):
+            getattr(out, name)[:self._n] = getattr(self, name)[:self._n]
+        out._wave_palette = list(self._wave_palette)
+        out._wave_index = dict(self._wave_index)
+        out.events = list(self.events)
+        return out
+
+    def row_of(self, clip_id: int) -> int:
+        """Current row of the clip with this id, or -1 once it has been removed."""
+        hits = np.flatnonzero(self.ids == clip_id)
+        return int(hits[0]) if len(hits) else -1
+
+    def view(self, row: int) -> 'TimelineClip':
+        return TimelineClip(self, row, int(self._ids[row]))
+
+    def views(self) -> list['TimelineClip']:
+        return [TimelineClip(self, row, clip_id) for row, clip_id in enumerate(self.ids.tolist())]
+
+    # Batch queries over whole columns
+    def durations(self) -> np.ndarray:
+        if self._durations is None:
+            self._durations = np.maximum(0.0, self.end_s - self.start_s)
+        return self._durations
+
+    def total_duration(self) -> float:
+        return float(self.end_s.max()) if self._n else 0.0
+
+    def actuators(self) -> list[int]:
+        # Plain set: np.unique drags in numpy.ma on first use, which the
+        # empty timeline used to pay for during window construction
+        return sorted(set(self.actuator.tolist()))
+
+    def rows_for_actuator(self, actuator: int, t0_s: Optional[float] = None,
+                          t1_s: Optional[float] = None) -> np.ndarray:
+        """Rows on one actuator in start-time order, optionally limited to the [t0_s, t1_s] window."""
+        rows = self._actuator_index().get(int(actuator))
+        if rows is None:
+            return np.empty(0, dtype=np.intp)
+        if t1_s is not None:
+            # Starts are sorted: everything past t1_s is cut with one binary search
+            rows = rows[:np.searchsorted(self.start_s[rows], t1_s, side='right')]
+        if t0_s is not None:
+            rows = rows[self.end_s[rows] >= t0_s]
+        return rows
+
+    def visible(self, t0_s: float, t1_s: float) -> np.ndarray:
+        """Rows overlapping the [t0_s, t1_s] time window."""
+        return np.flatnonzero((self.end_s >= t0_s) & (self.start_s <= t1_s))
+
+    def active_at(self, t_s: float) -> np.ndarray:
+        """Rows whose clip spans time t_s."""
+        return np.flatnonzero((self.start_s <= t_s) & (t_s <= self.end_s))
+
+
+@dataclass(frozen=True, slots=True)
 class TimelineClip:
-    actuator: int
-    start_s: float
-    end_s: float
-    waveform_name: str
-    event: Optional['HapticEvent']  # can be None
+    """Read-only view of one ClipTable row; views of the same clip compare equal.
+
+    `row` is where the clip sat when the view was made. Reads check it against
+    the clip id and fall back to row_of() after removals shifted the rows, so
+    a retained view keeps reading its own clip; once that clip is removed,
+    reading it raises LookupError.
+    """
+    table: ClipTable = field(repr=False)
+    row: int = field(compare=False)
+    clip_id: int
+
+    def _current_row(self) -> int:
+        t = self.table
+        row = self.row
+        if row < t._n and t._ids[row] == self.clip_id:
+            return row
+        row = t.row_of(self.clip_id)
+        if row < 0:
+            raise LookupError(f"clip {self.clip_id} was removed from the timeline")
+        return row
+
+    @property
+    def actuator(self) -> int:
+        return int(self.table._actuator[self._current_row()])
+
+    @property
+    def start_s(self) -> float:
+        return float(self.table._start_s[self._current_row()])
+
+    @property
+    def end_s(self) -> float:
+        return float(self.table._end_s[self._current_row()])
+
+    @property
+    def waveform_name(self) -> str:
+        return self.table.waveform_name(self._current_row())
+
+    @property
+    def event(self) -> Optional['HapticEvent']:
+        return self.table.events[self._current_row()]
 
     @property
     def duration(self) -> float:
-        return max(0.0, float(self.end_s) - float(self.start_s))
\ No newline at end of file
+        return float(self.table.durations()[self._current_row()])
+
+
+@dataclass(frozen=True, eq=False)
+class StrokeSchedule:
+    """Drawn-stroke playback steps as parallel arrays, one row per step.
+
+    Every step of a schedule lasts dur_ms and drives the same number k of
+    actuators (1, 2 or 3 depending on the phantom mode), so the bursts are
+    two fixed-width (N, k) columns.
+    """
+    t_on: np.ndarray    # (N,) onset in ms from the start, ascending
+    pt: np.ndarray      # (N, 2) normalized stroke point
+    addr: np.ndarray    # (N, k) actuator addresses
+    inten: np.ndarray   # (N, k) intensities, 1..15
+    dur_ms: int = 0
+
+    @classmethod
+    def empty(cls) -> 'StrokeSchedule':
+        return cls(np.empty(0), np.empty((0, 2)), np.empty((0, 1), dtype=np.int16), np.empty((0, 1), dtype=np.int8))
+
+    def __len__(self) -> int:
+        return len(self.t_on)
+
+    def bursts(self, i: int) -> list[tuple[int, int]]:
+        """(addr, intensity) pairs of step i."""
+        return list(zip(self.addr[i].tolist(), self.inten[i].tolist()))
+
+    def point(self, i: int) -> tuple[float, float]:
+        return tuple(self.pt[i].tolist())
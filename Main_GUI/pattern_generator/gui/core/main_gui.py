@@ -1,17 +1,26 @@
 import sys
 import os
+import math
 import time
+import logging
+from collections import OrderedDict, deque
 from datetime import datetime
+from pathlib import Path
+import numpy as np
 
-# Configuration du PYTHONPATH pour les imports externes
-current_dir = os.path.dirname(os.path.abspath(__file__))  # gui/
-pattern_generator = os.path.dirname(current_dir)          # pattern_generator/
-main_gui = os.path.dirname(pattern_generator)             # Main_GUI/
-if main_gui not in sys.path:
-    sys.path.insert(0, main_gui)
+log = logging.getLogger(__name__)
+
+# Resolved once: pattern_generator/ and Main_GUI/
+PATTERN_GENERATOR_DIR = Path(__file__).resolve().parents[2]
+MAIN_GUI_DIR = PATTERN_GENERATOR_DIR.parent
+
+# Configuration du PYTHONPATH pour les imports externes (core, gui.widgets)
+if str(PATTERN_GENERATOR_DIR) not in sys.path:
+    sys.path.insert(0, str(PATTERN_GENERATOR_DIR))
 
 from PyQt6.QtCore import (
-    Qt, QTimer, QProcess, QProcessEnvironment, QSize
+    Qt, QTimer, QProcess, QProcessEnvironment, QSize, QFileSystemWatcher, QSignalBlocker,
+    QStringListModel
 )
 from PyQt6.QtGui import (
     QAction, QActionGroup, QKeySequence, QShortcut,
@@ -23,14 +32,15 @@ from PyQt6.QtWidgets import (
     QTabWidget, QScrollArea, QFrame,
     QGroupBox, QLabel, QPushButton, QComboBox, QSlider,
     QSpinBox, QDoubleSpinBox, QTextEdit, QLineEdit,
-    QMessageBox, QStyleFactory, QStatusBar,
+    QMessageBox, QStyleFactory, QStatusBar, QProgressBar,
     QSizePolicy, QMenu, QDialog, QDialogButtonBox
 )
 
 
 try:
     # Relative imports for when used as module
-    from ..core.constants import PATTERN_PARAMETERS, PREMADE_PATTERNS
+    from ..core.constants import PatternType, pattern_params, premade_patterns, premade_param, clamp_params
+    from ..core.data_models import StrokeSchedule
     from ..utils.managers import (WaveformLibraryManager, EventLibraryManager, 
                                 PatternLibraryManager, DrawingLibraryManager)
     from ..widgets.actuator_widgets import MultiCanvasSelector
@@ -38,12 +48,13 @@ try:
     from ..widgets.drawing_widgets import DrawingStudioTab
     from ..widgets.pattern_widgets import UnifiedPatternLibraryWidget
     from ..utils.preview_drivers import PatternPreviewDriver
-    from ..utils.workers import PatternWorker, StrokePlaybackWorker
+    from ..utils.workers import PatternWorker, StrokePlaybackWorker, PortScanWorker, SerialLinkWorker
     from ..dialogs.dialogs import SavePatternDialog
     from ..utils.utils import centralize_drawn_stroke_playback_in_drawing
 except ImportError:
     # Absolute imports for when executed directly
-    from core.constants import PATTERN_PARAMETERS, PREMADE_PATTERNS
+    from core.constants import PatternType, pattern_params, premade_patterns, premade_param, clamp_params
+    from core.data_models import StrokeSchedule
     from utils.managers import (WaveformLibraryManager, EventLibraryManager, 
                                PatternLibraryManager, DrawingLibraryManager)
     from widgets.actuator_widgets import MultiCanvasSelector
@@ -51,36 +62,65 @@ except ImportError:
     from widgets.drawing_widgets import DrawingStudioTab
     from widgets.pattern_widgets import UnifiedPatternLibraryWidget
     from utils.preview_drivers import PatternPreviewDriver
-    from utils.workers import PatternWorker, StrokePlaybackWorker
+    from utils.workers import PatternWorker, StrokePlaybackWorker, PortScanWorker, SerialLinkWorker
     from dialogs.dialogs import SavePatternDialog
     from utils.utils import centralize_drawn_stroke_playback_in_drawing
 
-# Imports externes
+# Imports externes (only what __init__ needs; the phantom engine is typing-only here)
 try:
-    from core import PhantomEngine, PreviewBundle
-    from core.storage import save_bundle, load_bundle, list_bundles
     from communication import python_serial_api
     from core.vibration_patterns import *
-    from gui.widgets.flexible_actuator_selector import FlexibleActuatorSelector
-    from gui.widgets.phantom_preview_canvas import PhantomPreviewCanvas
 except ImportError as e:
-    print(f"Warning: Some external modules not found: {e}")
+    log.warning("Some external modules not found: %s", e)
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from core import PhantomEngine, PreviewBundle
 
 
 class HapticPatternGUI(QMainWindow):
+    _EXPANDING = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+    _PORTS_CACHE_TTL = 2.0  # seconds a finished port scan answers Scan Ports without rescanning
+
     def __init__(self):
         super().__init__()
         
+        # Log lines are queued and written to the panel in batches (see _flush_log).
+        # Bounded: a flood (e.g. a HW error per step) keeps only the newest lines.
+        self._log_queue: deque[str] = deque(maxlen=500)
+        self._log_dropped = 0
+        self._last_status = ""
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        # Optional widgets: only built by _create_info_section / the commented-out
+        # test button, so they stay None in the current layout
+        self.infoGroup = None
+        self.infoTextEdit = None
+        self.testActuatorBtn = None
+        
         # Initialize API and patterns
         self.api = python_serial_api()
         self.current_pattern = None
         self.pattern_worker = None
+        self._port_scan_worker = None
+        self._link_worker = None  # SerialLinkWorker while a connect/disconnect is in flight
+        self._designer_proc = None
+        # Designer stdout/stderr is buffered and logged in batches (see _flush_designer_log)
+        self._designer_log = bytearray()
+        self._designer_log_timer = QTimer(self)
+        self._designer_log_timer.setSingleShot(True)
+        self._designer_log_timer.setInterval(100)
+        self._designer_log_timer.timeout.connect(self._flush_designer_log)
         self.is_running = False
         
         # Initialize library managers
         self.pattern_manager = PatternLibraryManager()
         self.event_manager = EventLibraryManager()
         self.wf_manager = WaveformLibraryManager()
+        # Parsed library events, LRU by (path, mtime_ns); see _load_event_cached
+        self._event_cache: OrderedDict[tuple, object] = OrderedDict()
         
         # Current waveform tracking
         self.current_waveform_source = "Built-in Oscillators"
@@ -112,19 +152,24 @@ class HapticPatternGUI(QMainWindow):
         self._create_ui()
         self._name_widgets_for_qss()
         self.setup_connection_menu()     # build the Connection menu
-        self.setup_waveform_menu()
-        self._scan_ports_menu()          # preload menu with ports
-        if hasattr(self, "connectionGroup"):
-            self.connectionGroup.hide()  # keep widgets for signals, but hide the top bar
+        self.setup_waveform_menu()       # ports are scanned when the Ports menu first opens
         self._connect_signals()
-        self.scan_ports()
         self.preview_driver = PatternPreviewDriver(self.canvas_selector, self)
         self._stroke_worker = None
+        self._stroke_id_to_xy = {}  # anchors of the stroke being played, for step markers
+        self._stroke_overlay = None  # overlay showing the played stroke's marker, resolved at Play
         self._stroke_preview_timer = QTimer(self)
-        self._stroke_preview_timer.setInterval(30)  # ~33 FPS
+        # Single-shot, re-armed for the next step's onset instead of polling
+        self._stroke_preview_timer.setSingleShot(True)
+        self._stroke_preview_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._stroke_preview_timer.timeout.connect(self._on_stroke_preview_tick)
-        self._stroke_preview_state = None  # dict with schedule, t0, id_to_xy, idx
+        self._stroke_preview_state = None  # dict with schedule, t0, id_to_xy, overlay, idx
+        self._schedule_cache = None  # (key, schedule) of the last built stroke schedule
         self._stroke_playing = False
+
+        # Shown only once the whole tree, menus and object names are in place,
+        # so the first show does a single polish and layout pass
+        self.showMaximized()
     
     def _preview_drawn_stroke(self):
         """Construit le même schedule que pour le hardware, mais l'anime en UI uniquement."""
@@ -157,7 +202,7 @@ class HapticPatternGUI(QMainWindow):
         step_ms = int(self.strokeStepMs.value())
         Av = int(max(1, min(15, self.intensitySlider.value())))
         total_time_s = float(self.durationSpinBox.value())
-        schedule = self._build_stroke_schedule(poly, id_to_xy, step_ms, total_time_s, mode, Av)
+        schedule = self._stroke_schedule_cached(poly, id_to_xy, step_ms, total_time_s, mode, Av)
         if not schedule:
             QMessageBox.information(self, "Preview", "Failed to build a schedule from the drawing.")
             return
@@ -166,13 +211,10 @@ class HapticPatternGUI(QMainWindow):
             "schedule": schedule,
             "t0": time.perf_counter(),
             "id_to_xy": id_to_xy,
+            "overlay": self._show_marker_overlay(),
             "idx": -1
         }
-        ov = getattr(self.drawing_tab, "_overlay", None)
-        if ov:
-            ov.setVisible(True)
-            ov.raise_()
-        self._stroke_preview_timer.start()
+        self._stroke_preview_timer.start(0)
         self._log_info(f"Drawing preview: {len(schedule)} steps")
     
     def load_premade_template(self, preset: dict):
@@ -188,8 +230,9 @@ class HapticPatternGUI(QMainWindow):
 
             # 2) Pattern type first → rebuild specific params UI
             pt = cfg.get("pattern_type", "Single Pulse")
+            # currentTextChanged is delivered synchronously; the explicit call also
+            # resets the editors when the pattern type doesn't change
             self.patternComboBox.setCurrentText(pt)
-            QApplication.processEvents()
             self._create_pattern_specific_params()
 
             # 3) Global parameters (these drive both Preview & device playback)
@@ -211,17 +254,14 @@ class HapticPatternGUI(QMainWindow):
                     self._log_info(f"Premade '{preset['name']}': waveform '{wf.get('name')}' not found, keeping '{after}'")
 
             # 5) Pattern-specific fields
+            #    (catalog presets resolve through the flat index; others fall back to their config)
             sp = cfg.get("specific_parameters", {})
-            for key, widget in getattr(self, "pattern_specific_widgets", {}).items():
-                if key in sp:
-                    try:
-                        widget.setValue(sp[key])
-                    except Exception:
-                        pass
+            preset_name = preset.get("name", "")
+            self._apply_specific_params(pt, lambda key: premade_param(preset_name, key, sp.get(key)))
 
             # 6) Actuators → the MultiCanvasSelector helper auto-creates chains if needed
-            acts = list(cfg.get("actuators", []))
-            if acts and hasattr(self, "canvas_selector"):
+            acts = np.asarray(cfg.get("actuators", ()), dtype=int).tolist()
+            if acts:
                 self.canvas_selector.load_actuator_configuration(acts)
 
             self._log_info(f"Premade pattern loaded: {preset.get('name', 'Unnamed')}")
@@ -232,6 +272,13 @@ class HapticPatternGUI(QMainWindow):
             self._log_info(f"Error applying premade: {e}")
             QMessageBox.critical(self, "Error", f"Failed to apply premade pattern:\n{e}")
     
+    @staticmethod
+    def _bind_value_label(slider: QSlider, label: QLabel):
+        """Mirror an integer slider into a label using texts precomputed for its range."""
+        lo = slider.minimum()
+        texts = tuple(str(v) for v in range(lo, slider.maximum() + 1))
+        slider.valueChanged.connect(lambda v: label.setText(texts[v - lo]))
+
     def _create_global_parameters_section(self, layout: QVBoxLayout):
         """
         Global Parameters shared by both Timeline playback and Drawn-stroke phantoms:
@@ -249,12 +296,12 @@ class HapticPatternGUI(QMainWindow):
         self.intensitySlider.setValue(7)
 
         self.intensityValueLabel = QLabel(str(self.intensitySlider.value()))
-        intensityWrap = QWidget()
-        iw = QHBoxLayout(intensityWrap)
+        # Rows take the slider+label layout directly: no wrapper QWidget per row
+        iw = QHBoxLayout()
         iw.setContentsMargins(0, 0, 0, 0)
         iw.addWidget(self.intensitySlider)
         iw.addWidget(self.intensityValueLabel)
-        form.addRow("Intensity (gain):", intensityWrap)
+        form.addRow("Intensity (gain):", iw)
 
         # ── Device frequency code [0..7] — now a slider for consistency
         self.strokeFreqCode = QSlider(Qt.Orientation.Horizontal)
@@ -269,16 +316,13 @@ class HapticPatternGUI(QMainWindow):
         )
 
         self.freqCodeValueLabel = QLabel(str(self.strokeFreqCode.value()))
-        self.strokeFreqCode.valueChanged.connect(
-            lambda v: self.freqCodeValueLabel.setText(str(v))
-        )
+        self._bind_value_label(self.strokeFreqCode, self.freqCodeValueLabel)
 
-        freqWrap = QWidget()
-        fw = QHBoxLayout(freqWrap)
+        fw = QHBoxLayout()
         fw.setContentsMargins(0, 0, 0, 0)
         fw.addWidget(self.strokeFreqCode)
         fw.addWidget(self.freqCodeValueLabel)
-        form.addRow("Device freq code:", freqWrap)
+        form.addRow("Device freq code:", fw)
 
         layout.addWidget(group)
     
@@ -289,8 +333,7 @@ class HapticPatternGUI(QMainWindow):
         self.timeline_panel.setMinimumHeight(200)
         self.timeline_panel.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)  # Change to Fixed
         
-        if hasattr(self, 'canvas_selector'):
-            self.timeline_panel.attach_canvas_selector(self.canvas_selector)
+        self.timeline_panel.attach_canvas_selector(self.canvas_selector)
         
         parent_layout.addWidget(self.timeline_panel)
 
@@ -299,31 +342,47 @@ class HapticPatternGUI(QMainWindow):
         if not st:
             self._stroke_preview_timer.stop(); return
         elapsed_ms = (time.perf_counter() - st["t0"]) * 1000.0
-        # avancer tant que des steps sont dus
-        advanced = False
-        while st["idx"] + 1 < len(st["schedule"]) and st["schedule"][st["idx"] + 1]["t_on"] <= elapsed_ms:
-            st["idx"] += 1
-            advanced = True
-        if not advanced:
-            return
-        # afficher l'état courant
-        step = st["schedule"][st["idx"]]
-        active_ids = [aid for (aid, _inten) in step["bursts"]]
-        try:
-            self.canvas_selector.set_preview_active(active_ids)
-        except Exception:
-            pass
-        try:
-            ov = getattr(self.drawing_tab, "_overlay", None)
-            if ov and hasattr(ov, "show_preview_marker"):
-                ov.show_preview_marker(step.get("pt", (0.5,0.5)), st["id_to_xy"], step["bursts"])
-        except Exception:
-            pass
-        # arrêt si fini
-        if st["idx"] >= len(st["schedule"]) - 1:
-            self._stroke_preview_timer.stop()
-            self._log_info("Drawing preview: done")
+        # dernier step dû
+        schedule = st["schedule"]
+        new_idx = int(np.searchsorted(schedule.t_on, elapsed_ms, side='right')) - 1
+        if new_idx > st["idx"]:
+            st["idx"] = new_idx
+            # afficher l'état courant (seulement sur les widgets réellement à l'écran)
+            i = st["idx"]
+            if self._on_screen(self.canvas_selector):
+                active_ids = schedule.addr[i].tolist()
+                try:
+                    self.canvas_selector.set_preview_active(active_ids)
+                except Exception:
+                    pass
+            ov = st["overlay"]
+            try:
+                if self._on_screen(ov):
+                    ov.show_preview_marker(schedule.point(i), st["id_to_xy"], schedule.bursts(i))
+            except Exception:
+                pass
+            # arrêt si fini
+            if st["idx"] >= len(schedule) - 1:
+                self._log_info("Drawing preview: done")
+                return
+        # réveil au début du step suivant
+        elapsed_ms = (time.perf_counter() - st["t0"]) * 1000.0
+        self._stroke_preview_timer.start(max(1, math.ceil(schedule.t_on[st["idx"] + 1] - elapsed_ms)))
     
+    def _show_marker_overlay(self):
+        """Raise the drawing overlay for a stroke preview/playback; returns it, or None
+        if it can't show step markers. Resolved once per run, not on every step."""
+        ov = getattr(self.drawing_tab, "_overlay", None)
+        if ov:
+            ov.setVisible(True)
+            ov.raise_()
+        return ov if ov is not None and hasattr(ov, "show_preview_marker") else None
+
+    @staticmethod
+    def _on_screen(widget) -> bool:
+        """True if the widget is shown and not fully covered, i.e. painting it is visible."""
+        return widget is not None and widget.isVisible() and not widget.visibleRegion().isEmpty()
+
     def _get_overlay_json(self) -> dict | None:
         """Grab the current overlay JSON from the Drawing Studio tab."""
         try:
@@ -335,25 +394,20 @@ class HapticPatternGUI(QMainWindow):
         return None
 
 
-    def _extract_last_polyline(self, data: dict) -> list[tuple[float,float]]:
+    def _extract_last_polyline(self, data: dict) -> np.ndarray:
         """
-        Return a list of normalized (x,y) in [0..1] from the most recent stroke.
+        Return an (N, 2) array of normalized (x,y) in [0..1] from the most recent stroke.
         Fallback: concatenate all strokes.
         """
         strokes = data.get("strokes", [])
-        if not strokes:
-            return []
         # pick the last stroke with points
         for s in reversed(strokes):
             pts = s.get("points") or []
             if len(pts) >= 2:
-                return [(float(x), float(y)) for (x,y) in pts]
+                return np.asarray(pts, dtype=np.float64).reshape(-1, 2)
         # fallback: concat everything
-        pts_all = []
-        for s in strokes:
-            pts = s.get("points") or []
-            pts_all.extend([(float(x), float(y)) for (x,y) in pts])
-        return pts_all
+        pts_all = [pt for s in strokes for pt in (s.get("points") or [])]
+        return np.asarray(pts_all, dtype=np.float64).reshape(-1, 2)
 
 
     def _get_actuator_positions_for_overlay(self, overlay_json: dict) -> dict[int, tuple[float,float]]:
@@ -382,58 +436,59 @@ class HapticPatternGUI(QMainWindow):
         return m
 
 
-    def _build_stroke_schedule(self, poly_xy: list[tuple[float,float]], id_to_xy: dict[int,tuple[float,float]],
-                            duration_ms: int, total_time_s: float, mode: str, Av: int) -> list[dict]:
+    def _stroke_schedule_cached(self, poly_xy: np.ndarray, id_to_xy, duration_ms, total_time_s, mode, Av):
+        """_build_stroke_schedule, reused while the stroke, anchors and settings
+        are unchanged (e.g. Preview then Play)."""
+        key = (poly_xy.tobytes(), tuple(id_to_xy.items()), duration_ms, total_time_s, mode, Av)
+        if self._schedule_cache is None or self._schedule_cache[0] != key:
+            schedule = self._build_stroke_schedule(poly_xy, id_to_xy, duration_ms, total_time_s, mode, Av)
+            self._schedule_cache = (key, schedule)
+        return self._schedule_cache[1]
+
+    def _build_stroke_schedule(self, poly_xy: np.ndarray, id_to_xy: dict[int,tuple[float,float]],
+                            duration_ms: int, total_time_s: float, mode: str, Av: int) -> StrokeSchedule:
         """
-        Return a list of steps: [{t_on, dur_ms, bursts=[(addr,intensity), ...]}].
+        Return the steps as a StrokeSchedule (t_on, pt, burst addr/intensity columns).
         SOA is computed from Eq.(1): SOA_ms = 0.32*duration + 47.3.
         No overlap guaranteed if duration ≤ 69 ms (Eq.(11)).
         """
         if len(poly_xy) < 2 or not id_to_xy:
-            return []
+            return StrokeSchedule.empty()
 
         duration_ms = int(max(20, min(69, duration_ms)))
         soa_ms = 0.32 * duration_ms + 47.3  # Eq. (1), ms domain
         n_samples = max(2, int((total_time_s * 1000.0) / soa_ms))
         samples = StrokePlaybackWorker._resample_polyline(poly_xy, n_samples)
 
-        schedule = []
-        t = 0.0
-        for p in samples:
-            neigh   = StrokePlaybackWorker._nearest_n(p, id_to_xy, 3)
-            if mode.startswith("Physical"):
-                # nearest 1
-                addr = neigh[0][0]
-                bursts = [(addr, Av)]
-            elif "2-Act" in mode:
-                (a1,d1),(a2,d2) = neigh[:2]
-                A1,A2   = StrokePlaybackWorker._phantom_intensities_2act(d1,d2,Av)
-                bursts = [(a1,A1),(a2,A2)]
-            else:
-                (a1,d1),(a2,d2),(a3,d3) = neigh[:3]
-                A1,A2,A3= StrokePlaybackWorker._phantom_intensities_3act(d1,d2,d3,Av)
-                bursts = [(a1,A1),(a2,A2),(a3,A3)]
-
-            schedule.append({
-                "t_on": t,
-                "dur_ms": duration_ms,
-                "bursts": bursts,
-                "pt": p
-            })
-            t += soa_ms
-
-        return schedule
+        # Nearest anchors and phantom intensities for every sample at once
+        ids = np.fromiter(id_to_xy.keys(), dtype=int, count=len(id_to_xy))
+        nodes_xy = np.array(list(id_to_xy.values()), dtype=np.float64)
+        k = 1 if mode.startswith("Physical") else 2 if "2-Act" in mode else 3
+        if k > len(ids):
+            k = 1  # not enough anchors for a phantom: nearest-1
+        nearest, dists = StrokePlaybackWorker._nearest_n(samples, nodes_xy, k)
+        if k == 1:
+            amps = np.full(nearest.shape, Av)
+        else:
+            amps = StrokePlaybackWorker._phantom_intensities(dists, Av)
+
+        return StrokeSchedule(
+            t_on=np.arange(len(samples)) * soa_ms,
+            pt=samples,
+            addr=ids[nearest].astype(np.int16),
+            inten=amps.astype(np.int8),
+            dur_ms=duration_ms,
+        )
 
 
     def _play_drawn_stroke(self):
         """Entry point when user clicks 'Play Drawing'."""
         # DEBUG : Vérifications d'état
-        self._log_info(f"DEBUG: _play_drawn_stroke called")
-        self._log_info(f"DEBUG: is_running = {self.is_running}")
-        self._log_info(f"DEBUG: _stroke_worker = {self._stroke_worker}")
-        self._log_info(f"DEBUG: API connected = {self.api.connected if self.api else 'No API'}")
-        if hasattr(self, '_stroke_playing'):
-            self._log_info(f"DEBUG: _stroke_playing = {self._stroke_playing}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("_play_drawn_stroke called: is_running=%s, _stroke_worker=%s, "
+                      "API connected=%s, _stroke_playing=%s",
+                      self.is_running, self._stroke_worker,
+                      self.api.connected if self.api else 'No API', self._stroke_playing)
         
         # Nettoyer l'état précédent si nécessaire
         if self._stroke_worker and self._stroke_worker.isRunning():
@@ -449,18 +504,6 @@ class HapticPatternGUI(QMainWindow):
             QMessageBox.warning(self, "Hardware", "Please connect to a device first.")
             return
 
-        # Test simple de l'API avant de commencer
-        try:
-            # Test très bref sur un actuateur
-            self.api.send_command(0, 1, 4, 1)  
-            time.sleep(0.005)  # 5ms seulement
-            self.api.send_command(0, 0, 0, 0)  
-            self._log_info("DEBUG: API test command successful")
-        except Exception as e:
-            self._log_info(f"DEBUG: API test failed: {e}")
-            QMessageBox.warning(self, "API Test", f"API communication test failed: {e}")
-            return
-
         data = self._get_overlay_json()
         if not data:
             QMessageBox.information(self, "Drawing", "No drawing found. Use the Drawing Studio overlay.")
@@ -480,7 +523,7 @@ class HapticPatternGUI(QMainWindow):
         step_ms = int(self.strokeStepMs.value())
         Av = int(max(1, min(15, self.intensitySlider.value())))
         total_time_s = float(self.durationSpinBox.value())
-        schedule = self._build_stroke_schedule(poly, id_to_xy, step_ms, total_time_s, mode, Av)
+        schedule = self._stroke_schedule_cached(poly, id_to_xy, step_ms, total_time_s, mode, Av)
         if not schedule:
             QMessageBox.information(self, "Schedule", "Failed to build a schedule from the drawing.")
             return
@@ -493,14 +536,21 @@ class HapticPatternGUI(QMainWindow):
 
         # Marquer qu'on est en train de jouer un stroke
         self._stroke_playing = True
+        self._stroke_id_to_xy = id_to_xy
+        self._stroke_overlay = self._show_marker_overlay()
         
         self._log_info(f"Playing drawn stroke → mode='{mode}', steps={len(schedule)}, step={step_ms}ms, total≈{total_time_s:.2f}s")
         self._stroke_worker = StrokePlaybackWorker(self.api, schedule, self.strokeFreqCode.value())
         self._stroke_worker.log_message.connect(self._log_info)
+        self._stroke_worker.probe_failed.connect(self._on_stroke_probe_failed)
         self._stroke_worker.finished.connect(self._on_stroke_finished)
-        self._stroke_worker.start()
         self._stroke_worker.step_started.connect(self._on_stroke_step_started)
+        self._stroke_worker.start()
     
+    def _on_stroke_probe_failed(self, err: str):
+        self._log_info(f"DEBUG: API test failed: {err}")
+        QMessageBox.warning(self, "API Test", f"API communication test failed: {err}")
+
     def _test_single_actuator(self):
         """Test un seul actuateur pour vérifier que l'API fonctionne"""
         if not self.api or not self.api.connected:
@@ -515,7 +565,7 @@ class HapticPatternGUI(QMainWindow):
         try:
             actuator_id = selected[0]
             intensity = self.intensitySlider.value()
-            freq = self.strokeFreqCode.value() if hasattr(self, 'strokeFreqCode') else 4
+            freq = self.strokeFreqCode.value()
             
             self._log_info(f"Testing actuator {actuator_id} with intensity {intensity}, freq {freq}")
             
@@ -548,14 +598,9 @@ class HapticPatternGUI(QMainWindow):
             
             # Éteindre tous les actuateurs avec un délai pour être sûr
             try:
-                # Éteindre d'abord les actuateurs sélectionnés
-                selected_actuators = self._get_selected_actuators()
-                for aid in selected_actuators:
-                    self.api.send_command(aid, 0, 0, 0)
-                
-                # Puis faire un nettoyage plus large pour être sûr
-                for aid in range(32):  # éteindre les 32 premiers actuateurs
-                    self.api.send_command(aid, 0, 0, 0)
+                # Actuateurs sélectionnés + les 32 premiers pour être sûr, en une seule écriture
+                stop_ids = np.union1d(self._get_selected_actuators(), np.arange(32))
+                self.api.send_uniform(stop_ids, 0, 0, 0)
                     
             except Exception as e:
                 self._log_info(f"Error stopping actuators: {e}")
@@ -572,23 +617,25 @@ class HapticPatternGUI(QMainWindow):
                 
             self._log_info("Drawn stroke: stopped and cleaned")
     
-    def _on_stroke_step_started(self, idx: int, bursts: list, pt: tuple):
-        ov = getattr(self.drawing_tab, "_overlay", None)
-        if ov:
-            ov.setVisible(True)
-            ov.raise_()
-        active = [aid for (aid, _i) in bursts]
-        try:
-            self.canvas_selector.set_preview_active(active)
-        except Exception:
-            pass
+    def _on_stroke_step_started(self, _idx: int):
+        worker = self._stroke_worker
+        if worker is None:
+            return
+        # Render the newest step only; the worker skipped signalling the ones in between
+        idx = worker.take_step()
+        bursts = worker.schedule.bursts(idx)
+        pt = worker.schedule.point(idx)
+        if self._on_screen(self.canvas_selector):
+            active = [aid for (aid, _i) in bursts]
+            try:
+                self.canvas_selector.set_preview_active(active)
+            except Exception:
+                pass
+        ov = self._stroke_overlay
         try:
-            ov = getattr(self.drawing_tab, "_overlay", None)
-            if ov and hasattr(ov, "show_preview_marker"):
-                # id_to_xy vient du dernier build; si besoin, recalculer depuis overlay
-                data = self._get_overlay_json() or {}
-                id_to_xy = self._get_actuator_positions_for_overlay(data)
-                ov.show_preview_marker(pt, id_to_xy, bursts)
+            if self._on_screen(ov):
+                # id_to_xy du build courant: pas de relecture de l'overlay à chaque step
+                ov.show_preview_marker(pt, self._stroke_id_to_xy, bursts)
         except Exception:
             pass
 
@@ -602,11 +649,10 @@ class HapticPatternGUI(QMainWindow):
         try:
             selected_actuators = self._get_selected_actuators()
             if selected_actuators:
-                self._log_info(f"DEBUG: Cleaning up selected actuators: {selected_actuators}")
-                for aid in selected_actuators:
-                    self.api.send_command(aid, 0, 0, 0)
+                log.debug("Cleaning up selected actuators: %s", selected_actuators)
+                self.api.send_uniform(selected_actuators, 0, 0, 0)
             else:
-                self._log_info("DEBUG: No selected actuators to clean up")
+                log.debug("No selected actuators to clean up")
         except Exception as e:
             self._log_info(f"Error in actuator cleanup: {e}")
         
@@ -637,17 +683,20 @@ class HapticPatternGUI(QMainWindow):
         self.menu_waveform.addAction(self.act_refresh_library)
 
     def _open_waveform_designer(self):
-        here = os.path.dirname(os.path.abspath(__file__))       # gui/core/
-        gui_dir = os.path.dirname(here)                         # gui/
-        pattern_generator = os.path.dirname(gui_dir)            # pattern_generator/
-        main_gui = os.path.dirname(pattern_generator)           # Main_GUI/
+        # Reuse the designer that is already open instead of spawning a second one
+        if self._designer_proc is not None and self._designer_proc.state() != QProcess.ProcessState.NotRunning:
+            self._log_info("Universal Event Designer is already running")
+            return
+
+        main_gui = str(MAIN_GUI_DIR)
 
         # We will launch the designer as a MODULE so that relative imports work
         module_path = ["-m", "waveform_designer.event_designer.main"]
 
         # Prepare process
         self._designer_proc = QProcess(self)
-        self._designer_proc.finished.connect(lambda *_: self.refresh_waveforms())
+        self._designer_proc.finished.connect(self._on_designer_finished)
+        self._designer_proc.errorOccurred.connect(self._on_designer_error)
 
         # 1) Ensure the working directory is Main_GUI so resources/paths resolve
         self._designer_proc.setWorkingDirectory(main_gui)
@@ -665,21 +714,49 @@ class HapticPatternGUI(QMainWindow):
         self._designer_proc.setProcessEnvironment(env)
 
         # Optional: capture logs to your info panel
+        # (bound to the process itself: _designer_proc is cleared once it finishes)
+        proc = self._designer_proc
         try:
-            self._designer_proc.readyReadStandardError.connect(
-                lambda: self._log_info(self._designer_proc.readAllStandardError().data().decode(errors='ignore'))
+            proc.readyReadStandardError.connect(
+                lambda: self._buffer_designer_output(proc.readAllStandardError())
             )
-            self._designer_proc.readyReadStandardOutput.connect(
-                lambda: self._log_info(self._designer_proc.readAllStandardOutput().data().decode(errors='ignore'))
+            proc.readyReadStandardOutput.connect(
+                lambda: self._buffer_designer_output(proc.readAllStandardOutput())
             )
         except Exception:
             pass
 
-        # Start using current Python interpreter and run as module
+        # Start using current Python interpreter and run as module;
+        # a launch failure is reported through errorOccurred, so the UI never blocks here
         self._designer_proc.start(sys.executable, module_path)
-        if not self._designer_proc.waitForStarted(3000):
+
+    def _buffer_designer_output(self, data):
+        self._designer_log += data.data()
+        if not self._designer_log_timer.isActive():
+            self._designer_log_timer.start()
+
+    def _flush_designer_log(self, final: bool = False):
+        """Log the complete lines gathered since the last flush in one entry;
+        a trailing partial line waits for more output unless `final`."""
+        buf = self._designer_log
+        cut = len(buf) if final else buf.rfind(b"\n") + 1
+        if cut > 0:
+            text = buf[:cut].decode(errors='ignore').rstrip("\n")
+            del buf[:cut]
+            if text:
+                self._log_info(text)
+
+    def _on_designer_finished(self, *_):
+        self._designer_log_timer.stop()
+        self._flush_designer_log(final=True)
+        self._designer_proc = None
+        self.wf_manager.invalidate()  # the designer may have saved within the same mtime tick
+        self.refresh_waveforms()
+
+    def _on_designer_error(self, error):
+        if error == QProcess.ProcessError.FailedToStart:
+            self._designer_proc = None
             QMessageBox.critical(self, "Waveform Designer", "Failed to start Universal Event Designer.")
-            return
 
     def setup_connection_menu(self):
         """Build 'Connection' menu and move controls from the top bar into it."""
@@ -688,6 +765,23 @@ class HapticPatternGUI(QMainWindow):
         self._ports_actions = {}
         self.ports_group = QActionGroup(self)
         self.ports_group.setExclusive(True)
+        # One connection for every port action; each action carries its port in data()
+        self.ports_group.triggered.connect(lambda act: self._select_port(act.data()))
+        self._ports_cache = None  # (time.monotonic() of the scan, ports)
+        self._applied_ports = None  # port list the menu and legacy combo currently show
+
+        # Hotplug (Linux): a device node appearing or vanishing drops the cache;
+        # rescans are debounced so a burst of udev changes scans once
+        self._ports_rescan_timer = QTimer(self)
+        self._ports_rescan_timer.setSingleShot(True)
+        self._ports_rescan_timer.setInterval(200)
+        self._ports_rescan_timer.timeout.connect(self._scan_ports_menu)
+        self._ports_watcher = None
+        if sys.platform.startswith("linux"):
+            dirs = [d for d in ("/dev/serial/by-id", "/dev") if os.path.isdir(d)]
+            if dirs:
+                self._ports_watcher = QFileSystemWatcher(dirs, self)
+                self._ports_watcher.directoryChanged.connect(self._on_device_dir_changed)
 
         mb = self.menuBar()
         self.menu_connection = mb.addMenu("&Connection")
@@ -701,7 +795,8 @@ class HapticPatternGUI(QMainWindow):
         # Dynamic Ports submenu
         self.menu_ports = QMenu("Ports", self)
         self.menu_connection.addMenu(self.menu_ports)
-        self._refresh_ports_menu([])
+        # Filled on demand: opening the menu rescans unless the last scan is still fresh
+        self.menu_ports.aboutToShow.connect(self._scan_ports_menu)
 
         self.menu_connection.addSeparator()
 
@@ -716,21 +811,59 @@ class HapticPatternGUI(QMainWindow):
         self.act_disconnect.triggered.connect(self._do_disconnect)
         self.menu_connection.addAction(self.act_disconnect)
 
+        # Busy bar shown in the status bar while a connect/disconnect is in flight
+        self._link_busy = QProgressBar()
+        self._link_busy.setRange(0, 0)
+        self._link_busy.setFixedWidth(80)
+        self._link_busy.setMaximumHeight(12)
+        self._link_busy.setTextVisible(False)
+        self._link_busy.hide()
+
         # Initial state
         self._update_connection_actions()
         # Optional: show status in the status bar (bottom)
         if not self.statusBar():
             self.setStatusBar(QStatusBar(self))
+        self.statusBar().addPermanentWidget(self._link_busy)
         self.statusBar().showMessage("Status: Disconnected")
 
     def _scan_ports_menu(self):
-        ports = self._scan_available_ports()
+        """Start a port scan in the background; _on_ports_scanned applies the result.
+        Within _PORTS_CACHE_TTL of the last scan the menu already shows it, so nothing is done."""
+        if self._port_scan_worker is not None:
+            return  # a scan is already in flight
+        cache = self._ports_cache
+        if cache is not None and time.monotonic() - cache[0] < self._PORTS_CACHE_TTL:
+            return
+        self.act_scan.setEnabled(False)
+        self.scanPortsButton.setEnabled(False)
+        self.statusBar().showMessage("Scanning ports…")
+        self._port_scan_worker = PortScanWorker(self.api)
+        self._port_scan_worker.finished.connect(self._on_ports_scanned)
+        self._port_scan_worker.start()
+
+    def _on_ports_scanned(self, ports: list):
+        self._port_scan_worker = None
+        self._ports_cache = (time.monotonic(), ports)
+        self._update_connection_actions()
+        self.scanPortsButton.setEnabled(True)
+        self._apply_ports(ports)
+
+    def _on_device_dir_changed(self, _path: str):
+        self._ports_cache = None
+        # Closed menu: the next open rescans. Open menu: refresh what the user is looking at.
+        if self.menu_ports.isVisible():
+            self._ports_rescan_timer.start()
+
+    def _apply_ports(self, ports: list):
+        self.statusBar().showMessage(f"Found {len(ports)} port(s)")  # replaces "Scanning ports…"
+        if ports == self._applied_ports:
+            return  # same ports as last time: no menu/combo rebuild, re-selection or log line
+        self._applied_ports = list(ports)
         self._refresh_ports_menu(ports)
         # keep legacy combo in sync (even if hidden)
-        if hasattr(self, "portComboBox"):
-            self.portComboBox.clear()
-            self.portComboBox.addItems(ports)
-        self.statusBar().showMessage(f"Found {len(ports)} port(s)")
+        self.portComboBox.clear()
+        self.portComboBox.addItems(ports)
         self._log_info(f"Found {len(ports)} port(s)" if ports else "No ports found")
     
     def setup_view_menu(self):
@@ -745,23 +878,31 @@ class HapticPatternGUI(QMainWindow):
         self.menu_view.addAction(self.act_show_log)
 
     def _set_log_visible(self, visible: bool):
-        if hasattr(self, "infoGroup"):
+        if self.infoGroup is not None:
             self.infoGroup.setVisible(visible)
-        if visible and hasattr(self, "infoTextEdit"):
-            from PyQt6.QtGui import QTextCursor
+        if visible and self.infoTextEdit is not None:
             # Qt6: enums are namespaced
             self.infoTextEdit.moveCursor(QTextCursor.MoveOperation.End)
             self.infoTextEdit.ensureCursorVisible()
 
     def _refresh_ports_menu(self, ports: list[str]):
-        self.menu_ports.clear()
-        self._ports_actions.clear()
+        # Diff against the current actions: drop vanished ports, create new ones, reuse the rest
+        for p in set(self._ports_actions).difference(ports):
+            act = self._ports_actions.pop(p)
+            self.ports_group.removeAction(act)
+            self.menu_ports.removeAction(act)
+            act.deleteLater()
         for p in ports:
-            act = QAction(p, self, checkable=True)
-            self.ports_group.addAction(act)
-            self.menu_ports.addAction(act)
-            act.triggered.connect(lambda checked, port=p: self._select_port(port))
-            self._ports_actions[p] = act
+            if p not in self._ports_actions:
+                act = QAction(p, self, checkable=True)
+                act.setData(p)
+                self.ports_group.addAction(act)
+                self._ports_actions[p] = act
+        ordered = [self._ports_actions[p] for p in ports]
+        if self.menu_ports.actions() != ordered:
+            # Only re-lists the menu entries; the actions themselves are kept
+            self.menu_ports.clear()
+            self.menu_ports.addActions(ordered)
 
         # Keep previous selection if still available; else preselect first
         if ports:
@@ -775,48 +916,64 @@ class HapticPatternGUI(QMainWindow):
 
     def _do_connect(self):
         # fallback to legacy combo if no menu selection yet
-        if not self.selected_port and hasattr(self, "portComboBox"):
+        if not self.selected_port:
             self._select_port(self.portComboBox.currentText() or None)
         if not self.selected_port:
-            QMessageBox.information(self, "Connect", "Select a port first.")
+            if self._ports_cache is None:
+                self._scan_ports_menu()  # nothing scanned yet: fill Connection → Ports meanwhile
+            QMessageBox.information(self, "Connect", "Select a port first (Connection → Ports).")
             return
-        try:
-            ok = bool(self.api.connect_serial_device(self.selected_port))
-            self.is_connected = ok
-        except Exception as e:
-            self.is_connected = False
-            QMessageBox.warning(self, "Connect", str(e))
+        if self._link_worker is not None:
+            return  # a connect/disconnect is already in flight
+        self._start_link_worker(self.selected_port, self._on_connect_done,
+                                f"Status: Connecting… ({self.selected_port})")
+
+    def _on_connect_done(self, ok: bool, err: str):
+        self._link_worker = None
+        self._link_busy.hide()
+        self.is_connected = ok
         self._update_connection_actions()
         self.statusBar().showMessage(
             f"Status: Connected ({self.selected_port})" if self.is_connected else "Status: Disconnected"
         )
-        if hasattr(self, "statusLabel"):
-            self.statusLabel.setText("Status: Connected" if self.is_connected else "Status: Disconnected")
-        
+        self.statusLabel.setText("Status: Connected" if self.is_connected else "Status: Disconnected")
+        if not ok:
+            # Roll back the optimistic "Connecting…" state before explaining why
+            QMessageBox.warning(self, "Connect", err or f"Could not open {self.selected_port}.")
 
     def _do_disconnect(self):
-        try:
-            self.api.disconnect_serial_device()
-        except Exception as e:
-            QMessageBox.warning(self, "Disconnect", str(e))
+        if self._link_worker is not None:
+            return
+        self._start_link_worker(None, self._on_disconnect_done, "Status: Disconnecting…")
+
+    def _on_disconnect_done(self, _ok: bool, err: str):
+        self._link_worker = None
+        self._link_busy.hide()
+        if err:
+            QMessageBox.warning(self, "Disconnect", err)
         self.is_connected = False
         self._update_connection_actions()
         self.statusBar().showMessage("Status: Disconnected")
-        if hasattr(self, "statusLabel"):
-            self.statusLabel.setText("Status: Disconnected")
+        self.statusLabel.setText("Status: Disconnected")
+
+    def _start_link_worker(self, port, on_done, status: str):
+        """Open (port) or close (None) the serial link in the background.
+        The pending state shows right away: status text, busy bar, connection
+        actions disabled until on_done(ok, err) settles it."""
+        self._link_worker = SerialLinkWorker(self.api, port)
+        self._link_worker.finished.connect(on_done)
+        self._update_connection_actions()
+        self.statusBar().showMessage(status)
+        self.statusLabel.setText(status)
+        self._link_busy.show()
+        self._link_worker.start()
 
     def _update_connection_actions(self):
-        self.act_connect.setEnabled(not self.is_connected)
-        self.act_disconnect.setEnabled(self.is_connected)
-        self.menu_ports.setEnabled(not self.is_connected)
-        self.act_scan.setEnabled(not self.is_connected)
-
-    def _scan_available_ports(self) -> list[str]:
-        """Use existing serial API to enumerate ports."""
-        try:
-            return list(self.api.get_serial_devices())
-        except Exception:
-            return []
+        idle = self._link_worker is None
+        self.act_connect.setEnabled(idle and not self.is_connected)
+        self.act_disconnect.setEnabled(idle and self.is_connected)
+        self.menu_ports.setEnabled(idle and not self.is_connected)
+        self.act_scan.setEnabled(idle and not self.is_connected and self._port_scan_worker is None)
     
     def _create_ui(self):
         """Create the complete UI programmatically"""
@@ -854,8 +1011,6 @@ class HapticPatternGUI(QMainWindow):
         layout.setStretch(0, 0)  # connection bar
         layout.setStretch(1, 2)  # main workspace (left + right) - 2/3
         layout.setStretch(2, 1)  # timeline - 1/3
-
-        self.showMaximized()
     
     def _create_connection_group(self, layout):
         """Legacy top bar (now hidden)."""
@@ -875,6 +1030,7 @@ class HapticPatternGUI(QMainWindow):
         connectionLayout.addStretch()
         connectionLayout.addWidget(self.statusLabel)
 
+        self.connectionGroup.hide()  # keep widgets for signals, but hide the top bar
         layout.addWidget(self.connectionGroup)
     
     def _create_left_column(self, main_layout):
@@ -885,27 +1041,7 @@ class HapticPatternGUI(QMainWindow):
         
         # Create tab widget for Waveform Lab and Pattern Library
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #ccc;
-            }
-            QTabBar::tab {
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                border: 1px solid #ccc;
-                background-color: #f5f5f5;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                border-bottom: 1px solid white;
-                font-weight: bold;
-            }
-            QTabBar::tab:hover {
-                background-color: #eeeeee;
-            }
-        """)
+        self.tab_widget.setObjectName("leftTabs")  # styled by the app-wide haptic_pro.qss
         
         # Create Waveform Lab tab
         waveform_scroll = QScrollArea()
@@ -935,15 +1071,14 @@ class HapticPatternGUI(QMainWindow):
         self.drawing_tab = DrawingStudioTab()
         self.tab_widget.addTab(self.drawing_tab, "Drawing Studio")
 
-        if hasattr(self, "drawnStrokeGroup") and self.drawnStrokeGroup:
-            gb = self.drawnStrokeGroup
-            # detach from its old parent/layout
-            old_parent = gb.parentWidget()
-            if old_parent and old_parent.layout():
-                old_parent.layout().removeWidget(gb)
-            gb.setParent(self.drawing_tab)
-            # append at the bottom of Drawing Studio content
-            self.drawing_tab.layout().addWidget(gb)
+        gb = self.drawnStrokeGroup
+        # detach from its old parent/layout
+        old_parent = gb.parentWidget()
+        if old_parent and old_parent.layout():
+            old_parent.layout().removeWidget(gb)
+        gb.setParent(self.drawing_tab)
+        # append at the bottom of Drawing Studio content
+        self.drawing_tab.layout().addWidget(gb)
         centralize_drawn_stroke_playback_in_drawing(self)
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
         self.drawing_tab.bind_controls(self)
@@ -990,12 +1125,9 @@ class HapticPatternGUI(QMainWindow):
         self._create_control_section(layout)
 
         # <<< keep these hidden >>>
-        if hasattr(self, "grpPatternSelection"):
-            self.grpPatternSelection.setVisible(False)
-        if hasattr(self, "grpBasicParameters"):
-            self.grpBasicParameters.setVisible(False)
-        if hasattr(self, "specificParamsGroup"):
-            self.specificParamsGroup.setVisible(False)
+        self.grpPatternSelection.setVisible(False)
+        self.grpBasicParameters.setVisible(False)
+        self.specificParamsGroup.setVisible(False)
 
         layout.addStretch()
 
@@ -1071,7 +1203,7 @@ class HapticPatternGUI(QMainWindow):
 
     def _create_pattern_library_content(self, layout):
         """Single Pattern Library with two categories (Pre-made / Custom)."""
-        self.pattern_visualization = UnifiedPatternLibraryWidget(self.pattern_manager, PREMADE_PATTERNS)
+        self.pattern_visualization = UnifiedPatternLibraryWidget(self.pattern_manager, premade_patterns())
         # Wire like before (no behavior change)
         self.pattern_visualization.template_selected.connect(self.load_premade_template)
         self.pattern_visualization.pattern_selected.connect(self.load_pattern_from_library)
@@ -1097,6 +1229,9 @@ class HapticPatternGUI(QMainWindow):
         pick = QHBoxLayout(); pick.setSpacing(6)
         pick.addWidget(QLabel("Waveform:"))
         self.waveformComboBox = QComboBox()
+        # Backed by a string list so a refresh swaps the whole list in one model reset
+        self._wf_model = QStringListModel(self)
+        self.waveformComboBox.setModel(self._wf_model)
         pick.addWidget(self.waveformComboBox)
         v.addLayout(pick)
 
@@ -1121,10 +1256,7 @@ class HapticPatternGUI(QMainWindow):
         patternLayout.setContentsMargins(8, 5, 8, 5)
         
         self.patternComboBox = QComboBox()
-        self.patternComboBox.addItems([
-            "Single Pulse", "Wave", "Pulse Train", "Fade", 
-            "Circular", "Random", "Sine Wave"
-        ])
+        self.patternComboBox.addItems([str(pt) for pt in PatternType])
         patternLayout.addWidget(self.patternComboBox)
         
         self.patternDescLabel = QLabel("Single vibration pulse on selected actuators")
@@ -1175,8 +1307,9 @@ class HapticPatternGUI(QMainWindow):
         container.setContentsMargins(8, 6, 8, 6)
         container.setSpacing(6)
 
-        # Keep handle to the container so we can clear & refill it
+        # Keep handle to the container; each pattern's panel is added to it once
         self._specific_params_container = container
+        self._pattern_panels = {}  # pattern name -> (panel widget, {param name: editor})
         self.pattern_specific_widgets = {}
 
         # First build based on the current pattern
@@ -1234,19 +1367,18 @@ class HapticPatternGUI(QMainWindow):
         rightColumnLayout.setSpacing(6)
 
         actuatorGroup = QGroupBox("Actuator Selection & Design")
-        actuatorGroup.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        actuatorGroup.setSizePolicy(self._EXPANDING)
         actuatorLayout = QVBoxLayout(actuatorGroup)
         actuatorLayout.setContentsMargins(6, 0, 6, 6)   # was default (bigger on some styles)
         actuatorLayout.setSpacing(6)
 
         self.canvas_selector = MultiCanvasSelector()
         self.canvas_selector.selection_changed.connect(self.on_actuator_selection_changed)
-        self.canvas_selector.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.canvas_selector.setSizePolicy(self._EXPANDING)
         actuatorLayout.addWidget(self.canvas_selector, 1)
 
         try:
-            if hasattr(self, "drawing_tab") and self.drawing_tab is not None:
-                self.drawing_tab.attach_canvas_selector(self.canvas_selector)
+            self.drawing_tab.attach_canvas_selector(self.canvas_selector)
         except Exception:
             pass
 
@@ -1294,12 +1426,8 @@ class HapticPatternGUI(QMainWindow):
         self.patternComboBox.currentTextChanged.connect(self._on_pattern_change)
         
         # Basic parameter sliders
-        self.intensitySlider.valueChanged.connect(
-            lambda v: self.intensityValueLabel.setText(str(v))
-        )
-        self.frequencySlider.valueChanged.connect(
-            lambda v: self.frequencyValueLabel.setText(str(v))
-        )
+        self._bind_value_label(self.intensitySlider, self.intensityValueLabel)
+        self._bind_value_label(self.frequencySlider, self.frequencyValueLabel)
         
         # Control buttons
         self.startButton.clicked.connect(self.start_pattern)
@@ -1312,22 +1440,24 @@ class HapticPatternGUI(QMainWindow):
 
         self.playDrawingBtn.clicked.connect(self._play_drawn_stroke)
         self.stopDrawingBtn.clicked.connect(self._stop_drawn_stroke)
-        if hasattr(self, 'testActuatorBtn'):
+        if self.testActuatorBtn is not None:
             self.testActuatorBtn.clicked.connect(self._test_single_actuator)
     
     def refresh_waveforms(self):
-        self.waveformComboBox.clear()
         self._wf_entries = self.wf_manager.list_entries()
         self._wf_by_display = {e["display"]: e for e in self._wf_entries}
+        # Repopulate silently: the reset would fire on_waveform_changed (and a
+        # load_event); the selection is applied once below instead
+        with QSignalBlocker(self.waveformComboBox):
+            self._wf_model.setStringList([e["display"] for e in self._wf_entries] or ["No waveforms found"])
+            self.waveformComboBox.setCurrentIndex(0)
         if self._wf_entries:
-            self.waveformComboBox.addItems([e["display"] for e in self._wf_entries])
             self._log_info(f"Waveform Library → {self.wf_manager.lib_root}/customized "
                         f"→ {len(self._wf_entries)} file(s)")
         else:
-            self.waveformComboBox.addItem("No waveforms found")
             self._log_info(f"Waveform Library → {self.wf_manager.lib_root}/customized → 0 file")
-        if self.waveformComboBox.count() > 0:
-            self.update_waveform_info()
+        self.current_waveform_name = self.waveformComboBox.currentText()
+        self.update_waveform_info()
         
     def _on_preview_toggled(self, checked: bool):
         if checked:
@@ -1382,7 +1512,7 @@ class HapticPatternGUI(QMainWindow):
             self.current_event = None
             return
         entry = self._wf_by_display.get(name)
-        ev = self.wf_manager.load_event(entry) if entry else None
+        ev = self._load_event_cached(entry) if entry else None
         self.current_event = ev
         if ev and ev.waveform_data:
             dur = ev.waveform_data.duration or 0.0
@@ -1393,73 +1523,115 @@ class HapticPatternGUI(QMainWindow):
         else:
             self.waveformInfoLabel.setText("Failed to load waveform.")
     
+    _EVENT_CACHE_SIZE = 64
+
+    def _load_event_cached(self, entry):
+        """wf_manager.load_event, reusing the parsed event while the file is unchanged.
+        Events are shared read-only (timeline clips already share them)."""
+        try:
+            key = (entry["path"], os.stat(entry["path"]).st_mtime_ns)
+        except OSError:
+            return self.wf_manager.load_event(entry)
+        cache = self._event_cache
+        ev = cache.get(key)
+        if ev is not None:
+            cache.move_to_end(key)
+            return ev
+        ev = self.wf_manager.load_event(entry)
+        if ev is not None:  # failed loads are retried next time
+            cache[key] = ev
+            if len(cache) > self._EVENT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return ev
+
     def get_current_waveform_info(self):
         return {"source": "Waveform Library", "name": self.waveformComboBox.currentText(), "event": self.current_event}
     
     def _create_pattern_specific_params(self):
-        """(Re)build the content of the Pattern-Specific Parameters panel."""
-        # Clear previous widgets from the container
+        """Show the Pattern-Specific Parameters panel of the current pattern, reset to defaults.
+        Panels are built once per pattern and hidden, not destroyed, when another is selected."""
         container = getattr(self, "_specific_params_container", None)
         if container is None:
             return
-        self._clear_layout(container)
-
         pattern_name = self.patternComboBox.currentText()
-        self.pattern_specific_widgets = {}
-
-        pattern_config = PATTERN_PARAMETERS.get(pattern_name, {})
-        parameters = pattern_config.get("parameters", [])
+        # One repaint for the whole swap instead of one per child
+        self.specificParamsGroup.setUpdatesEnabled(False)
+        try:
+            entry = self._pattern_panels.get(pattern_name)
+            if entry is None:
+                entry = self._pattern_panels[pattern_name] = self._build_pattern_panel(pattern_name)
+                container.addWidget(entry[0])
+            for panel, _editors in self._pattern_panels.values():
+                panel.setVisible(panel is entry[0])
+
+            self.pattern_specific_widgets = entry[1]
+            for param in pattern_params(pattern_name):
+                editor = self.pattern_specific_widgets[param.name]
+                editor.setValue(param.default if param.type == "float" else int(param.default))
+
+            # Make sure geometry updates immediately
+            self.specificParamsGroup.adjustSize()
+            self.specificParamsGroup.updateGeometry()
+        finally:
+            self.specificParamsGroup.setUpdatesEnabled(True)
+
+    def _build_pattern_panel(self, pattern_name):
+        """Editors for one pattern's specific parameters; returns (panel, {param name: editor})."""
+        panel = QWidget()
+        editors = {}
+        parameters = pattern_params(pattern_name)
 
         if not parameters:
             # Show a small hint instead of an empty box
+            box = QVBoxLayout(panel)
+            box.setContentsMargins(0, 0, 0, 0)
             hint = QLabel("No additional parameters for this pattern.")
             hint.setStyleSheet("font-style: italic; color: #666;")
-            container.addWidget(hint)
-        else:
-            form = QFormLayout()
-            form.setContentsMargins(0, 0, 0, 0)
-            form.setSpacing(8)
-
-            for param in parameters:
-                label = QLabel(param["label"])
-                label.setToolTip(param.get("description", ""))
-
-                if param["type"] == "float":
-                    editor = QDoubleSpinBox()
-                    editor.setRange(*param["range"])
-                    editor.setSingleStep(param["step"])
-                    editor.setValue(param["default"])
-                    if param.get("suffix"):
-                        editor.setSuffix(param["suffix"])
-                else:  # "int"
-                    editor = QSpinBox()
-                    editor.setRange(*param["range"])
-                    editor.setSingleStep(param["step"])
-                    editor.setValue(param["default"])
-                    if param.get("suffix"):
-                        editor.setSuffix(param["suffix"])
-
-                editor.setToolTip(param.get("description", ""))
-                form.addRow(label, editor)
-                self.pattern_specific_widgets[param["name"]] = editor
-
-            container.addLayout(form)
-
-        # Make sure geometry updates immediately
-        self.specificParamsGroup.adjustSize()
-        self.specificParamsGroup.updateGeometry()
-    
-    def _clear_layout(self, layout):
-        """Clear all widgets from layout"""
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                widget = item.widget()
-                widget.setParent(None)
-                widget.deleteLater()
-            elif item.layout():
-                self._clear_layout(item.layout())
-    
+            box.addWidget(hint)
+            return panel, editors
+
+        form = QFormLayout(panel)
+        form.setContentsMargins(0, 0, 0, 0)
+        form.setSpacing(8)
+
+        for param in parameters:
+            label = QLabel(param.label)
+            label.setToolTip(param.description)
+
+            if param.type == "float":
+                editor = QDoubleSpinBox()
+                editor.setRange(param.lo, param.hi)
+                editor.setSingleStep(param.step)
+            else:  # "int"
+                editor = QSpinBox()
+                editor.setRange(int(param.lo), int(param.hi))
+                editor.setSingleStep(int(param.step))
+            if param.suffix:
+                editor.setSuffix(param.suffix)
+
+            editor.setToolTip(param.description)
+            form.addRow(label, editor)
+            editors[param.name] = editor
+
+        return panel, editors
+
+    def _apply_specific_params(self, pattern_name, lookup):
+        """Set the pattern-specific editors from `lookup(key)`, clamping all values in one pass.
+        Keys for which lookup returns None keep the editor's current value."""
+        specs = pattern_params(pattern_name)
+        widgets = getattr(self, "pattern_specific_widgets", {})
+        if not specs or any(p.name not in widgets for p in specs):
+            return
+        try:
+            values = []
+            for p in specs:
+                v = lookup(p.name)
+                values.append(widgets[p.name].value() if v is None else float(v))
+            for p, v in zip(specs, clamp_params(pattern_name, values).tolist()):
+                widgets[p.name].setValue(v if p.type == "float" else int(round(v)))
+        except Exception:
+            pass
+
     def _on_pattern_change(self):
         """Handle pattern selection change"""
         pattern_name = self.patternComboBox.currentText()
@@ -1467,16 +1639,6 @@ class HapticPatternGUI(QMainWindow):
             self.patternDescLabel.setText(self.patterns[pattern_name].description)
         self._create_pattern_specific_params()
     
-    def scan_ports(self):
-        """Scan for available serial ports"""
-        try:
-            ports = self.api.get_serial_devices()
-            self.portComboBox.clear()
-            self.portComboBox.addItems(ports)
-            self._log_info(f"Found {len(ports)} ports" if ports else "No ports found")
-        except Exception as e:
-            self._log_info(f"Error scanning ports: {e}")
-    
     def connect(self):
         """Connect to selected serial port"""
         port = self.portComboBox.currentText()
@@ -1560,7 +1722,7 @@ class HapticPatternGUI(QMainWindow):
         # Try exact display text first
         idx = self.waveformComboBox.findText(name)
         # If saved name was a base name (without bucket suffix), try to match by base
-        if idx < 0 and hasattr(self, "_wf_by_display"):
+        if idx < 0:
             base = name.split(" [", 1)[0]
             for display in self._wf_by_display.keys():
                 if display.split(" [", 1)[0] == base:
@@ -1599,10 +1761,8 @@ class HapticPatternGUI(QMainWindow):
             if config.get("pattern_type") == "Timeline":
                 try:
                     # switch left column visible and ensure Designer page
-                    if hasattr(self, "timeline_panel") and self.timeline_panel:
-                        self.timeline_panel.load_from_config(config)
-                    if hasattr(self, "canvas_selector"):
-                        self.canvas_selector.canvasCombo.setCurrentIndex(0)  # Designer
+                    self.timeline_panel.load_from_config(config)
+                    self.canvas_selector.canvasCombo.setCurrentIndex(0)  # Designer
                     self._log_info(f"Timeline '{pattern_info['name']}' loaded")
                     QMessageBox.information(self, "Timeline", f"Timeline '{pattern_info['name']}' loaded.")
                     return
@@ -1614,31 +1774,24 @@ class HapticPatternGUI(QMainWindow):
 
             # 1) Pattern type first
             self.patternComboBox.setCurrentText(config.get("pattern_type", "Single Pulse"))
-            QApplication.processEvents()
             self._create_pattern_specific_params()
 
             # 2) Basic parameters
             self.intensitySlider.setValue(int(config.get("intensity", 7)))
             self.durationSpinBox.setValue(float(config.get("duration", 2.0)))
-            if hasattr(self, "frequencySlider"):
-                self.frequencySlider.setValue(int(config.get("frequency", 0)))
+            self.frequencySlider.setValue(int(config.get("frequency", 0)))
 
             # 3) Waveform from library
             self._apply_loaded_waveform(config.get("waveform", {}))
 
             # 4) Pattern-specific params
             sp = config.get("specific_parameters", {})
-            for key, widget in getattr(self, "pattern_specific_widgets", {}).items():
-                if key in sp:
-                    try:
-                        widget.setValue(sp[key])
-                    except Exception:
-                        pass
+            self._apply_specific_params(self.patternComboBox.currentText(), sp.get)
 
             # (removed) restore playbackRateSpinBox/repeatSpinBox/offsetSpinBox — section deleted
 
             # 6) Actuators
-            if "actuators" in config and hasattr(self, "canvas_selector"):
+            if "actuators" in config:
                 self.canvas_selector.load_actuator_configuration(config.get("actuators", []))
 
             self._log_info(f"Pattern '{pattern_info['name']}' loaded from library")
@@ -1795,8 +1948,7 @@ class HapticPatternGUI(QMainWindow):
         try:
             actuators = self._get_selected_actuators()
             if actuators:
-                for addr in actuators:
-                    self.api.send_command(addr, 0, 0, 0)
+                self.api.send_uniform(actuators, 0, 0, 0)
                 self._log_info(f"Force stopped actuators: {actuators}")
         except Exception as e:
             self._log_info(f"Error force stopping actuators: {e}")
@@ -1806,8 +1958,7 @@ class HapticPatternGUI(QMainWindow):
         self._stop_drawn_stroke()
         self.stop_pattern()
         try:
-            for i in range(128):
-                self.api.send_command(i, 0, 0, 0)
+            self.api.send_uniform(np.arange(128), 0, 0, 0)
             self._log_info("Emergency stop executed - all actuators (0-127) stopped")
         except Exception as e:
             self._log_info(f"Emergency stop error: {e}")
@@ -1826,7 +1977,7 @@ class HapticPatternGUI(QMainWindow):
         self.emergency_stop()
         
         # Arrêter le stroke worker avec timeout plus long
-        if hasattr(self, '_stroke_worker') and self._stroke_worker and self._stroke_worker.isRunning():
+        if self._stroke_worker is not None and self._stroke_worker.isRunning():
             self._stroke_worker.stop()
             if not self._stroke_worker.wait(3000):
                 self._log_info("Force terminating stroke worker")
@@ -1835,54 +1986,77 @@ class HapticPatternGUI(QMainWindow):
             self._stroke_worker = None
         
         # Arrêter le pattern worker
-        if hasattr(self, 'pattern_worker') and self.pattern_worker and self.pattern_worker.isRunning():
+        if self.pattern_worker is not None and self.pattern_worker.isRunning():
+            self.pattern_worker.stop()
             if not self.pattern_worker.wait(2000):
                 self._log_info("Force terminating pattern worker")
                 self.pattern_worker.terminate()
                 self.pattern_worker.wait(1000)
             self.pattern_worker = None
         
+        # Laisser finir un scan de ports en cours (pas d'arrêt possible, il ne fait qu'énumérer)
+        if self._port_scan_worker is not None:
+            self._port_scan_worker.wait(3000)
+            self._port_scan_worker = None
+        if self._link_worker is not None:
+            self._link_worker.wait(3000)
+            self._link_worker = None
+        
         # Arrêter tous les timers
-        if hasattr(self, '_stroke_preview_timer'):
-            self._stroke_preview_timer.stop()
-        if hasattr(self, 'preview_timer'):
-            self.preview_timer.stop()
+        self._stroke_preview_timer.stop()
+        self.preview_timer.stop()
         
         # Arrêter le timeline panel
         try:
-            if hasattr(self, "timeline_panel") and self.timeline_panel:
-                self.timeline_panel.stop_all()
+            self.timeline_panel.stop_all()
         except Exception as e:
             self._log_info(f"Error stopping timeline: {e}")
         
         # Déconnecter l'API
-        if hasattr(self, 'api') and self.api and self.api.connected:
+        if self.api.connected:
             try:
                 self.api.disconnect_serial_device()
             except Exception as e:
                 self._log_info(f"Error disconnecting API: {e}")
         
         self._log_info("Cleanup completed")
+        self._log_flush_timer.stop()
+        self._flush_log()
         event.accept()
     
     def _log_info(self, message):
-        """Lightweight logger: status bar + stdout (text panel may not exist)."""
-        timestamp = time.strftime('%H:%M:%S')
-        log_message = f"{timestamp} - {message}"
+        """Lightweight logger: status bar + stdout (text panel may not exist).
+        Only queues the line; _flush_log writes the batch at most every 100 ms."""
+        if len(self._log_queue) == self._log_queue.maxlen:
+            self._log_dropped += 1
+        self._log_queue.append(f"{time.strftime('%H:%M:%S')} - {message}")
+        self._last_status = message
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        """Write all queued log lines with a single panel append and status update."""
+        if not self._log_queue:
+            return
+        text = "\n".join(self._log_queue)
+        self._log_queue.clear()
+        if self._log_dropped:
+            text = f"… {self._log_dropped} earlier line(s) dropped\n{text}"
+            self._log_dropped = 0
 
         # Show brief status
         try:
             if not self.statusBar():
                 self.setStatusBar(QStatusBar(self))
-            self.statusBar().showMessage(message, 4000)
+            self.statusBar().showMessage(self._last_status, 4000)
         except Exception:
             pass
 
         # Only append if the panel exists
-        if hasattr(self, "infoTextEdit") and self.infoTextEdit is not None:
-            self.infoTextEdit.append(log_message)
+        if self.infoTextEdit is not None:
+            self.infoTextEdit.append(text)
 
-        print(log_message)
+        print(text)
 
 def main():
     app = QApplication(sys.argv)
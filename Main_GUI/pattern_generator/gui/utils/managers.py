@@ -58,8 +58,22 @@ class WaveformLibraryManager:
 
         # helpful for logs
         self._which = "repo_root" if chosen == root_lib else "Main_GUI"
+        self._entries_cache = None  # (custom_dir mtime_ns, entries) of the last scan
+
+    def invalidate(self):
+        """Force the next list_entries() to rescan, e.g. after the designer saved a file."""
+        self._entries_cache = None
 
     def list_entries(self):
+        """Entries of custom_dir, sorted by file name. The listing only depends on
+        file names, so it is reused as long as the directory's mtime is unchanged."""
+        try:
+            mtime = os.stat(self.custom_dir).st_mtime_ns
+        except OSError:
+            mtime = None
+        cache = self._entries_cache
+        if mtime is not None and cache is not None and cache[0] == mtime:
+            return list(cache[1])
         entries = []
         try:
             for fn in sorted(os.listdir(self.custom_dir)):
@@ -69,7 +83,8 @@ class WaveformLibraryManager:
                     entries.append({"name": name, "display": name, "ext": ext.lower(), "path": path})
         except Exception as e:
             print(f"[WaveformLibrary] scan error: {e}")
-        return entries
+        self._entries_cache = (mtime, entries) if mtime is not None else None
+        return list(entries)
 
     def load_event(self, entry):
         if HapticEvent is None:
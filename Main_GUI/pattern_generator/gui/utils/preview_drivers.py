@@ -1,6 +1,8 @@
 import random
 from PyQt6.QtCore import QObject, QTimer
 
+from ..core.constants import PatternType
+
 class PatternPreviewDriver(QObject):
     """
     Lightweight UI-only animator that highlights which actuators are 'active'
@@ -18,12 +20,15 @@ class PatternPreviewDriver(QObject):
         self._total = 0.0
         self._cycle = 1.0
         self._pattern_name = ""
+        self._pattern_type = None
         self._params = {}
 
     def start(self, pattern_name: str, params: dict):
         """params must contain: actuators (list[int]), duration, repeat,
            playback_rate, and any pattern-specific fields (e.g., wave_speed…)."""
         self._pattern_name = pattern_name
+        # Resolve the name once; each tick then dispatches on the int
+        self._pattern_type = PatternType.from_name(pattern_name)
         self._params = dict(params)
         duration = float(params.get("duration", 1.0))
         rate = max(0.001, float(params.get("playback_rate", 1.0)))
@@ -61,37 +66,56 @@ class PatternPreviewDriver(QObject):
             pass
 
     def _active_at_time(self, t: float) -> list[int]:
-        name = self._pattern_name
         a = list(self._params.get("actuators", []))
         if not a:
             return []
+        pt = self._pattern_type
+        if pt is None:
+            return a
+        return _ACTIVE_AT[pt](a, self._params, t)
+
+
+def _one_of_sweep(a: list[int], sweep: float, t: float) -> list[int]:
+    n = len(a)
+    sweep = max(0.05, sweep)
+    progress = (t % sweep) / sweep
+    idx = int(progress * n) % n
+    return [a[idx]]
+
+
+def _all_active(a, sp, t):
+    return a
+
+
+def _wave_active(a, sp, t):
+    return _one_of_sweep(a, float(sp.get("wave_speed", 0.5)), t)
+
+
+def _pulse_train_active(a, sp, t):
+    on_t  = float(sp.get("pulse_on", 0.2))
+    off_t = float(sp.get("pulse_off", 0.3))
+    cyc = max(0.05, on_t + off_t)
+    return a if (t % cyc) < on_t else []
+
+
+def _circular_active(a, sp, t):
+    return _one_of_sweep(a, float(sp.get("rotation_speed", 1.0)), t)
+
+
+def _random_active(a, sp, t):
+    interval = float(sp.get("change_interval", 0.3))
+    k = int(t / max(0.05, interval))
+    rng = random.Random(k)
+    return [rng.choice(a)]
+
 
-        sp = self._params
-
-        if name == "Wave":
-            n = len(a)
-            sweep = max(0.05, float(sp.get("wave_speed", 0.5)))
-            progress = (t % sweep) / sweep
-            idx = int(progress * n) % n
-            return [a[idx]]
-
-        if name == "Circular":
-            n = len(a)
-            sweep = max(0.05, float(sp.get("rotation_speed", 1.0)))
-            progress = (t % sweep) / sweep
-            idx = int(progress * n) % n
-            return [a[idx]]
-
-        if name == "Random":
-            interval = float(sp.get("change_interval", 0.3))
-            k = int(t / max(0.05, interval))
-            rng = random.Random(k)
-            return [rng.choice(a)]
-
-        if name == "Pulse Train":
-            on_t  = float(sp.get("pulse_on", 0.2))
-            off_t = float(sp.get("pulse_off", 0.3))
-            cyc = max(0.05, on_t + off_t)
-            return a if (t % cyc) < on_t else []
-
-        return a  # Single Pulse / Fade / Sine Wave
\ No newline at end of file
+# Indexed by PatternType; Single Pulse / Fade / Sine Wave keep every actuator lit
+_ACTIVE_AT = (
+    _all_active,            # SINGLE_PULSE
+    _wave_active,           # WAVE
+    _pulse_train_active,    # PULSE_TRAIN
+    _all_active,            # FADE
+    _circular_active,       # CIRCULAR
+    _random_active,         # RANDOM
+    _all_active,            # SINE
+)
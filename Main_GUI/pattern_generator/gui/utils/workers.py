@@ -1,73 +1,20 @@
 import time
-import math
-from typing import Optional
-from PyQt6.QtCore import QThread, pyqtSignal, QObject
-from ..core.data_models import TimelineClip
-from ..utils.utils import _sample_event_amplitude
+from typing import TYPE_CHECKING
 
-class TimelineModel(QObject):
-    changed = pyqtSignal()
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+from ..utils.utils import _sample_event_amplitude
 
-    def __init__(self):
-        super().__init__()
-        self._clips: list[TimelineClip] = []
-        self._selected: Optional[TimelineClip] = None
-
-    def clips(self) -> list[TimelineClip]:
-        return list(self._clips)
-
-    def clear(self):
-        self._clips.clear()
-        self._selected = None
-        self.changed.emit()
-
-    def add_clip_for_actuators(self, actuators: list[int],
-                               event: Optional['HapticEvent'],
-                               waveform_name: str,
-                               start_s: float, end_s: float):
-        start_s = max(0.0, float(start_s))
-        end_s   = max(start_s, float(end_s))
-        for a in sorted(set(int(x) for x in actuators)):
-            self._clips.append(TimelineClip(a, start_s, end_s, waveform_name, event))
-        self.changed.emit()
-
-    def remove_clip(self, clip: TimelineClip):
-        try:
-            self._clips.remove(clip)
-        except ValueError:
-            pass
-        if self._selected is clip:
-            self._selected = None
-        self.changed.emit()
-
-    def set_selected(self, clip: Optional[TimelineClip]):
-        self._selected = clip
-        self.changed.emit()
-
-    def selected(self) -> Optional[TimelineClip]:
-        return self._selected
-
-    def total_duration(self) -> float:
-        if not self._clips: return 0.0
-        return max((c.end_s for c in self._clips), default=0.0)
-
-    def actuators(self) -> list[int]:
-        return sorted({c.actuator for c in self._clips})
-
-    # Preview helper: who is active at time t?
-    def active_actuators_at(self, t_s: float) -> list[int]:
-        out = []
-        for c in self._clips:
-            if c.start_s <= t_s <= c.end_s:
-                out.append(c.actuator)
-        return sorted(set(out))
+if TYPE_CHECKING:
+    from ..core.data_models import StrokeSchedule
+    from ..widgets.timeline_widgets import TimelineModel
 
 class TimelineDeviceWorker(QThread):
     """Play the timeline on hardware by streaming intensity updates."""
     finished = pyqtSignal(bool, str)
     log_message = pyqtSignal(str)
 
-    def __init__(self, api, model: TimelineModel, total_s: float, max_intensity: int,
+    def __init__(self, api, model: 'TimelineModel', total_s: float, max_intensity: int,
                  freq_code: int, tick_ms: int = 50):
         super().__init__()
         self.api = api
@@ -84,6 +31,8 @@ class TimelineDeviceWorker(QThread):
     def run(self):
         try:
             last_I: dict[int, int] = {}
+            # Play a snapshot: edits made in the GUI during playback can't shift rows under us
+            table = self.model.table().copy()
             t0 = time.perf_counter()
             while not self._stop:
                 elapsed_s = time.perf_counter() - t0
@@ -93,16 +42,17 @@ class TimelineDeviceWorker(QThread):
                 # compute target intensity for each actuator
                 # (if multiple overlapping clips on same actuator: take max)
                 target: dict[int, int] = {}
-                for c in self.model.clips():
-                    if c.start_s <= elapsed_s <= c.end_s:
-                        # time inside the clip
-                        local_t = elapsed_s - c.start_s
-                        amp = _sample_event_amplitude(c.event, local_t)
-                        Ii = int(round(amp * self.maxI))
-                        if Ii <= 0:
-                            continue
-                        if c.actuator not in target or Ii > target[c.actuator]:
-                            target[c.actuator] = Ii
+                active = table.active_at(elapsed_s)
+                for r, addr, start_s in zip(active.tolist(), table.actuator[active].tolist(),
+                                            table.start_s[active].tolist()):
+                    # time inside the clip
+                    local_t = elapsed_s - start_s
+                    amp = _sample_event_amplitude(table.events[r], local_t)
+                    Ii = int(round(amp * self.maxI))
+                    if Ii <= 0:
+                        continue
+                    if addr not in target or Ii > target[addr]:
+                        target[addr] = Ii
 
                 # send diffs
                 # turn on/update
@@ -141,47 +91,76 @@ class StrokePlaybackWorker(QThread):
     """Schedule and play a stroke schedule on hardware with explicit offs."""
     finished = pyqtSignal(bool, str)
     log_message = pyqtSignal(str)
-    step_started = pyqtSignal(int, list, tuple)
+    step_started = pyqtSignal(int)
+    probe_failed = pyqtSignal(str)
 
-    def __init__(self, api, schedule, freq_code:int):
+    def __init__(self, api, schedule: 'StrokeSchedule', freq_code:int):
         super().__init__()
         self.api = api
-        self.schedule = list(sorted(schedule, key=lambda s: s["t_on"]))
+        self.schedule = schedule  # steps are already in t_on order
         self.freq_code = int(max(0, min(7, freq_code)))
         self._stop_flag = False
+        # Latest step started; the UI is signalled only once it has taken the previous one
+        self.current_step = -1
+        self._step_pending = False
 
     def stop(self):
         self._stop_flag = True
 
+    def take_step(self) -> int:
+        """Latest started step index (-1 before the first), re-arming step_started.
+        Steps the UI was too busy to see in between are skipped, not queued."""
+        self._step_pending = False
+        return self.current_step
+
     def run(self):
         """Play the precomputed schedule on the device and emit UI updates.
 
         Emits:
-            - step_started(int index, list bursts, tuple pt): just before sending ON commands
+            - probe_failed(str error): if the short API test before playback fails
+            - step_started(int index): just before sending ON commands, coalesced
+              until the UI calls take_step(); bursts/point come from the schedule
             - log_message(str): on hardware errors
             - finished(bool ok, str message): at end or on error
         """
+        # Brief pulse on actuator 0 to check the link, here rather than on the UI thread
+        try:
+            self.api.send_command(0, 1, 4, 1)
+            time.sleep(0.005)
+            self.api.send_command(0, 0, 0, 0)
+        except Exception as e:
+            self.probe_failed.emit(str(e))
+            self.finished.emit(False, f"API communication test failed: {e}")
+            return
+
         try:
+            sched = self.schedule
+            t_on = sched.t_on.tolist()
+            t_off = (sched.t_on + sched.dur_ms).tolist()
             t0 = time.perf_counter()
             off_events = []  # list of {"t_off": ms_from_start, "addr": int}
             active_addrs = set()
 
-            for i, step in enumerate(self.schedule):
+            for i in range(len(sched)):
                 if self._stop_flag:
                     break
 
                 # Wait until the absolute onset time (in ms from t0)
-                while not self._stop_flag and (time.perf_counter() - t0) * 1000.0 < step["t_on"]:
+                while not self._stop_flag and (time.perf_counter() - t0) * 1000.0 < t_on[i]:
                     time.sleep(0.0005)
 
+                bursts = sched.bursts(i)
                 # Notify UI about the step that is starting
-                try:
-                    self.step_started.emit(i, step["bursts"], step.get("pt", (0.5, 0.5)))
-                except Exception:
-                    pass  # never break playback because of UI issues
+                self.current_step = i
+                if not self._step_pending:
+                    self._step_pending = True
+                    try:
+                        self.step_started.emit(i)
+                    except Exception:
+                        pass  # never break playback because of UI issues
 
                 # Send ON commands for this step
-                for addr, inten in step["bursts"]:
+                for addr, inten in bursts:
                     try:
                         self.api.send_command(int(addr), int(inten), self.freq_code, 1)
                         active_addrs.add(int(addr))
@@ -189,9 +168,9 @@ class StrokePlaybackWorker(QThread):
                         self.log_message.emit(f"HW error @on: {e}")
 
                 # Schedule OFF commands for this step
-                for addr, _ in step["bursts"]:
+                for addr, _ in bursts:
                     off_events.append({
-                        "t_off": step["t_on"] + step["dur_ms"],
+                        "t_off": t_off[i],
                         "addr": int(addr)
                     })
 
@@ -231,60 +210,32 @@ class StrokePlaybackWorker(QThread):
             self.finished.emit(False, f"Stroke worker error: {e}")
 
     @staticmethod
-    def _resample_polyline(points_xy: list[tuple[float,float]], n_samples: int) -> list[tuple[float,float]]:
-
-        """Arc-length resample of a polyline in [0..1]×[0..1]."""
-        if n_samples <= 1 or len(points_xy) < 2:
-            return points_xy[:1] * max(1, n_samples)
+    def _resample_polyline(points_xy, n_samples: int) -> np.ndarray:
+        """Arc-length resample of a polyline in [0..1]×[0..1]; returns an (n_samples, 2) array."""
+        pts = np.asarray(points_xy, dtype=np.float64).reshape(-1, 2)
+        n_samples = max(1, n_samples)
+        if n_samples == 1 or len(pts) < 2:
+            return np.repeat(pts[:1], n_samples, axis=0)
         # cumulative distances
-        d = [0.0]
-        for a,b in zip(points_xy, points_xy[1:]):
-            dx, dy = b[0]-a[0], b[1]-a[1]
-            d.append(d[-1] + math.hypot(dx, dy))
-        length = d[-1] if d[-1] > 0 else 1e-9
-        targets = [i*length/(n_samples-1) for i in range(n_samples)]
-        out = []
-        j = 0
-        for t in targets:
-            while j+1 < len(d) and d[j+1] < t:
-                j += 1
-            if j+1 >= len(d):
-                out.append(points_xy[-1]); continue
-            # local interpolation between j and j+1
-            seg = d[j+1] - d[j]
-            alpha = 0.0 if seg <= 0 else (t - d[j]) / seg
-            x = points_xy[j][0] + alpha * (points_xy[j+1][0]-points_xy[j][0])
-            y = points_xy[j][1] + alpha * (points_xy[j+1][1]-points_xy[j][1])
-            out.append((x,y))
-        return out
-
-    @staticmethod
-    def _nearest_n(point_xy: tuple[float,float], id_to_xy: dict[int,tuple[float,float]], n:int) -> list[tuple[int,float]]:
-        """Return list of (id, distance) for n nearest nodes to the point."""
-        items = []
-        for aid, (x,y) in id_to_xy.items():
-            items.append((aid, math.hypot(point_xy[0]-x, point_xy[1]-y)))
-        items.sort(key=lambda t: t[1])
-        return items[:max(1,n)]
+        d = np.concatenate(([0.0], np.cumsum(np.hypot(*np.diff(pts, axis=0).T))))
+        targets = np.linspace(0.0, d[-1] if d[-1] > 0 else 1e-9, n_samples)
+        return np.column_stack((np.interp(targets, d, pts[:, 0]), np.interp(targets, d, pts[:, 1])))
 
     @staticmethod
-    def _phantom_intensities_2act(d1: float, d2: float, Av: int) -> tuple[int,int]:
-        """Eq. (2) from Park et al. (Av in device units 1..15)."""
-        d1 = max(d1, 1e-6); d2 = max(d2, 1e-6)
-        A1 = math.sqrt(d2/(d1+d2)) * Av
-        A2 = math.sqrt(d1/(d1+d2)) * Av
-        return (max(1, min(15, round(A1))), max(1, min(15, round(A2))))
+    def _nearest_n(points_xy: np.ndarray, nodes_xy: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+        """For each point, indices into nodes_xy of its n nearest nodes and their distances,
+        both (S, n) and nearest first. Ties keep node order."""
+        n = max(1, min(n, len(nodes_xy)))
+        d2 = ((points_xy[:, None, :] - nodes_xy[None, :, :]) ** 2).sum(-1)
+        idx = np.argsort(d2, axis=1, kind="stable")[:, :n]
+        return idx, np.sqrt(np.take_along_axis(d2, idx, axis=1))
 
     @staticmethod
-    def _phantom_intensities_3act(d1: float, d2: float, d3: float, Av: int) -> tuple[int,int,int]:
-        """Eq. (10) from Park et al. — energy-based 3‑actuator phantom."""
-        d1 = max(d1, 1e-6); d2 = max(d2, 1e-6); d3 = max(d3, 1e-6)
-        inv = [1.0/d1, 1.0/d2, 1.0/d3]
-        s = sum(inv)
-        # Ai = sqrt((1/di)/sum(1/dj)) * Av
-        A = [math.sqrt(v/s) * Av for v in inv]
-        A = [max(1, min(15, round(a))) for a in A]
-        return (A[0], A[1], A[2])
+    def _phantom_intensities(dists: np.ndarray, Av: int) -> np.ndarray:
+        """Eq. (2) / Eq. (10) for a whole (S, k) distance array: Ai = sqrt((1/di)/sum(1/dj)) * Av."""
+        inv = 1.0 / np.maximum(dists, 1e-6)
+        A = np.sqrt(inv / inv.sum(axis=1, keepdims=True)) * Av
+        return np.clip(np.rint(A), 1, 15).astype(int)
 
 
 class PatternWorker(QThread):
@@ -297,6 +248,10 @@ class PatternWorker(QThread):
         self.pattern = pattern
         self.params = params
     
+    def stop(self):
+        """Ask the pattern to stop; its sleeps wake on the stop event right away."""
+        self.pattern.stop()
+    
     def run(self):
         try:
             result = self.pattern.execute(**self.params)
@@ -306,4 +261,42 @@ class PatternWorker(QThread):
         except Exception as e:
             error_msg = f"Pattern execution error: {e}"
             self.log_message.emit(error_msg)
-            self.finished.emit(False, error_msg)
\ No newline at end of file
+            self.finished.emit(False, error_msg)
+
+
+class PortScanWorker(QThread):
+    """Enumerate serial ports off the GUI thread (driver queries can take seconds)."""
+    finished = pyqtSignal(list)
+
+    def __init__(self, api):
+        super().__init__()
+        self.api = api
+
+    def run(self):
+        try:
+            ports = list(self.api.get_serial_devices())
+        except Exception:
+            ports = []
+        self.finished.emit(ports)
+
+
+class SerialLinkWorker(QThread):
+    """Open (port given) or close (port None) the serial link off the GUI thread.
+    Opening blocks for the board reset, about two seconds."""
+    finished = pyqtSignal(bool, str)  # ok, error message ("" if none)
+
+    def __init__(self, api, port: str | None = None):
+        super().__init__()
+        self.api = api
+        self.port = port
+
+    def run(self):
+        try:
+            if self.port is None:
+                self.api.disconnect_serial_device()
+                ok = True
+            else:
+                ok = bool(self.api.connect_serial_device(self.port))
+            self.finished.emit(ok, "")
+        except Exception as e:
+            self.finished.emit(False, str(e))
@@ -261,6 +261,7 @@ class MultiCanvasSelector(QWidget):
 
         self._designer_preview_mode = False
         self._designer_prev_selection: set[int] | None = None
+        self._preview_ids: frozenset[int] | None = None  # last set_preview_active input, None once cleared
 
         # Wire top buttons
         self.canvasCombo.currentIndexChanged.connect(self._on_canvas_changed)
@@ -300,19 +301,8 @@ class MultiCanvasSelector(QWidget):
 
     def _designer_apply_selection(self, ids: set[int]):
         """Applique une sélection exacte sur le canvas du Designer."""
-        canvas = getattr(self.designer, "canvas", None)
-        if not canvas or not hasattr(canvas, "actuators"):
-            return
-        for a in canvas.actuators:
-            try:
-                a.set_selected_state(int(getattr(a, "actuator_id", -1)) in ids)
-            except Exception:
-                pass
         try:
-            if hasattr(canvas, "on_actuator_selection_changed"):
-                canvas.on_actuator_selection_changed()
-            else:
-                canvas.update()
+            self.designer.set_selected_addresses(ids)
         except Exception:
             pass
     def current_nodes(self) -> list[tuple[int, float, float]]:
@@ -329,6 +319,11 @@ class MultiCanvasSelector(QWidget):
         return []
 
     def set_preview_active(self, ids: list[int] | set[int]):
+        # Consecutive frames often light the same actuators: skip the repaint then
+        new_ids = frozenset(int(i) for i in ids)
+        if new_ids == self._preview_ids:
+            return
+        self._preview_ids = new_ids
         try:
             self.grid3.canvas.set_active(ids)
         except Exception:
@@ -355,6 +350,7 @@ class MultiCanvasSelector(QWidget):
             pass
 
     def clear_preview(self):
+        self._preview_ids = None
         # canvases fixes
         try:
             self.grid3.canvas.clear_active()
@@ -400,11 +396,7 @@ class MultiCanvasSelector(QWidget):
         if not ids:
             # clear selection across designer
             try:
-                sel.select_none()
-            except Exception:
-                pass
-            try:
-                sel.canvas.on_actuator_selection_changed()
+                sel.set_selected_addresses(())
             except Exception:
                 pass
             return
@@ -437,20 +429,9 @@ class MultiCanvasSelector(QWidget):
                 except Exception:
                     pass
 
-        # Apply the selection
-        try:
-            sel.select_none()
-        except Exception:
-            pass
-
-        for a in getattr(sel.canvas, "actuators", []):
-            try:
-                a.set_selected_state(a.actuator_id in ids)
-            except Exception:
-                pass
-
+        # Apply the selection: one pass over the nodes, one selection_changed
         try:
-            sel.canvas.on_actuator_selection_changed()
+            sel.set_selected_addresses(ids)
         except Exception:
             pass
 
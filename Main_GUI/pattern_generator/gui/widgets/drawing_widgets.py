@@ -2,6 +2,8 @@ import os
 import json
 import time
 import math
+
+import numpy as np
 from PyQt6.QtCore import Qt, QTimer, QPoint, QPointF, QRectF, QSize
 from PyQt6.QtGui import (QPainter, QPen, QBrush, QColor, QFont, QImage, 
                         QPixmap, QKeySequence)
@@ -487,8 +489,7 @@ class DrawingCanvasOverlay(QWidget):
             self._draw_persistent_phantom(p["pt"], p["bursts"], f"P{p['id']}")
 
         # 3) ajouter n phantoms uniformément répartis sur le trait
-        for pt in samples:
-            bursts = self._compute_bursts_for_pt(pt)
+        for pt, bursts in zip(samples, self._compute_bursts_for_pts(samples)):
             pid = self._phantom_counter
             self._phantoms.append({"id": pid, "pt": pt, "bursts": bursts})
             self._draw_persistent_phantom(pt, bursts, f"P{pid}")
@@ -543,34 +544,27 @@ class DrawingCanvasOverlay(QWidget):
     def _compute_bursts_for_pt(self, pt_norm: tuple[float, float]) -> list[tuple[int,int]]:
         """Compute (actuator_id, intensity) set for a phantom at pt_norm,
         using current phantom mode and gain, based on nearest anchors in self._nodes."""
-        id_to_xy = {aid: (x, y) for (aid, x, y) in self._nodes}
-        if not id_to_xy:
-            return []
-        # Distances
-        items = []
-        for aid, (x, y) in id_to_xy.items():
-            d = math.hypot(pt_norm[0] - x, pt_norm[1] - y)
-            items.append((aid, d))
-        items.sort(key=lambda t: t[1])
+        return self._compute_bursts_for_pts([pt_norm])[0]
+
+    def _compute_bursts_for_pts(self, pts_norm) -> list[list[tuple[int,int]]]:
+        """_compute_bursts_for_pt for many points, with one distance/intensity pass over all of them."""
+        if not self._nodes:
+            return [[] for _ in pts_norm]
+        ids = np.array([aid for (aid, _x, _y) in self._nodes])
+        nodes_xy = np.array([(x, y) for (_aid, x, y) in self._nodes], dtype=np.float64)
 
         Av = int(self._phantom_gain)
         mode = self._phantom_mode or ""
-        try:
-            if mode.startswith("Physical"):
-                a1, _ = items[0]
-                return [(a1, Av)]
-            elif "2-Act" in mode:
-                (a1, d1), (a2, d2) = items[:2]
-                from_this = StrokePlaybackWorker._phantom_intensities_2act(d1, d2, Av)
-                return [(a1, from_this[0]), (a2, from_this[1])]
-            else:
-                (a1, d1), (a2, d2), (a3, d3) = items[:3]
-                A1, A2, A3 = StrokePlaybackWorker._phantom_intensities_3act(d1, d2, d3, Av)
-                return [(a1, A1), (a2, A2), (a3, A3)]
-        except Exception:
-            # fallback: nearest-1
-            a1, _ = items[0]
-            return [(a1, Av)]
+        k = 1 if mode.startswith("Physical") else 2 if "2-Act" in mode else 3
+        if k > len(ids):
+            k = 1  # not enough anchors for a phantom: nearest-1
+        nearest, dists = StrokePlaybackWorker._nearest_n(
+            np.asarray(pts_norm, dtype=np.float64).reshape(-1, 2), nodes_xy, k)
+        if k == 1:
+            amps = np.full(nearest.shape, Av)
+        else:
+            amps = StrokePlaybackWorker._phantom_intensities(dists, Av)
+        return [list(zip(a, i)) for a, i in zip(ids[nearest].tolist(), amps.tolist())]
 # DrawingCanvasOverlay._draw_persistent_phantom
     def _draw_persistent_phantom(self, pt_norm: tuple[float,float],
                                 bursts: list[tuple[int,int]], label: str):
@@ -23,15 +23,17 @@ PyQt: 6.x
 
 from __future__ import annotations
 
+import logging
 import string
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 from PyQt6.QtCore import (
-    Qt, QRectF, QPointF, QMimeData, QSize, pyqtSignal
+    Qt, QRectF, QPointF, QMimeData, QSize, QSignalBlocker, pyqtSignal
 )
 from PyQt6.QtGui import (
-    QPainter, QPen, QBrush, QColor, QFont, QAction, QDrag, QPixmap, QPainterPath, QCursor
+    QPainter, QPen, QBrush, QColor, QFont, QFontMetricsF, QAction, QDrag, QPixmap, QPainterPath, QCursor
 )
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
@@ -40,6 +42,8 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QStyle, QFrame, QSizePolicy
 )
 
+log = logging.getLogger(__name__)
+
 # ------------------------------- Constants -------------------------------- #
 
 ACTUATOR_SIZE = QSize(42, 42)
@@ -193,27 +197,68 @@ class ActuatorModel:
 
 class SelectableActuator(QGraphicsItem):
     """Visual item for an actuator. Knows its model id/type and branch color."""
+    # Label fonts and text metrics are shared by every item; built lazily (needs a QGuiApplication)
+    _FONT: Optional[QFont] = None
+    _FONT_SMALL: Optional[QFont] = None
+    # LRU keyed by (text, index text, device dpi), so it stays bounded however many ids are shown
+    _TEXT_METRICS_CACHE: OrderedDict[tuple, Tuple[float, float, float]] = OrderedDict()
+    _TEXT_METRICS_CACHE_SIZE = 512
+
+    @classmethod
+    def _label_fonts(cls) -> Tuple[QFont, QFont]:
+        if cls._FONT is None:
+            font = QFont(); font.setPointSizeF(9.5)
+            font_small = QFont(font); font_small.setPointSizeF(7.0)
+            cls._FONT, cls._FONT_SMALL = font, font_small
+        return cls._FONT, cls._FONT_SMALL
+
+    @classmethod
+    def _label_metrics(cls, text: str, idx_text: str, device=None) -> Tuple[float, float, float]:
+        """(branch text width, line height, index text width) on `device`, computed once per label and dpi."""
+        cache = cls._TEXT_METRICS_CACHE
+        dpi = (device.logicalDpiX(), device.logicalDpiY()) if device is not None else None
+        key = (text, idx_text, dpi)
+        m = cache.get(key)
+        if m is not None:
+            cache.move_to_end(key)
+            return m
+        font, font_small = cls._label_fonts()
+        if device is not None:
+            metrics, metrics_small = QFontMetricsF(font, device), QFontMetricsF(font_small, device)
+        else:
+            metrics, metrics_small = QFontMetricsF(font), QFontMetricsF(font_small)
+        m = (metrics.horizontalAdvance(text), metrics.height(), metrics_small.horizontalAdvance(idx_text))
+        cache[key] = m
+        if len(cache) > cls._TEXT_METRICS_CACHE_SIZE:
+            cache.popitem(last=False)
+        return m
+
     def __init__(self, model: ActuatorModel, size: QSize, parent: Optional[QGraphicsItem] = None):
         super().__init__(parent)
         self.model = model
         self.size = size
         self._w = size.width()
         self._h = size.height()
+        # Geometry is fixed per item: build the body/bounding rects once
+        self._rect = QRectF(-self._w * 0.5, -self._h * 0.5, self._w, self._h)
+        self._brect = self._rect.adjusted(-2.0, -2.0, 2.0, 2.0)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
-        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
+        # ItemSendsGeometryChanges is only enabled while lines hang off this node
+        # (see set_linked); isolated nodes report their move on mouse release.
+        self._linked = False
+        self._reported_pos: Optional[QPointF] = None
         self.setAcceptHoverEvents(True)
         self._canvas = None  # back‑reference set by ActuatorCanvas
         self.preview_active = False
 
     # ---- geometry ----
     def boundingRect(self) -> QRectF:
-        pad = 2.0
-        return QRectF(-self._w/2 - pad, -self._h/2 - pad, self._w + 2*pad, self._h + 2*pad)
+        return self._brect
 
     def shape(self) -> QPainterPath:
         path = QPainterPath()
-        r = QRectF(-self._w/2, -self._h/2, self._w, self._h)
+        r = self._rect
         if self.model.actuator_type == "LRA":
             path.addEllipse(r)
         elif self.model.actuator_type == "VCA":
@@ -223,7 +268,7 @@ class SelectableActuator(QGraphicsItem):
         return path
 
     def paint(self, p: QPainter, option, widget=None):
-        r = QRectF(-self._w/2, -self._h/2, self._w, self._h)
+        r = self._rect
         p.setRenderHints(QPainter.RenderHint.Antialiasing, True)
 
         # Fill: white by default; branch color when selected
@@ -251,16 +296,14 @@ class SelectableActuator(QGraphicsItem):
         # ID text: dark on white, light on colored
         text_pen = QPen(QColor("#0F172A") if not self.isSelected() else QColor("#FFFFFF"))
         p.setPen(text_pen)
-        font = QFont(); font.setPointSizeF(9.5); p.setFont(font)
+        font, font_small = self._label_fonts()
         branch, idx = split_id(self.model.actuator_id)
         text = branch
-        metrics = p.fontMetrics()
-        tw = metrics.horizontalAdvance(text)
-        th = metrics.height()
-        p.drawText(QPointF(-tw/2, th/4), text)
-        font_small = QFont(font); font_small.setPointSizeF(7.0); p.setFont(font_small)
         idx_text = f".{idx}"
-        itw = p.fontMetrics().horizontalAdvance(idx_text)
+        tw, th, itw = self._label_metrics(text, idx_text, p.device())
+        p.setFont(font)
+        p.drawText(QPointF(-tw/2, th/4), text)
+        p.setFont(font_small)
         p.drawText(QPointF(tw/2 - itw/2, th/1.2), idx_text)
 
         # Hover overlay
@@ -287,6 +330,13 @@ class SelectableActuator(QGraphicsItem):
                 p.drawRoundedRect(ring, 8, 8)
 
     # ---- helpers ----
+    def set_linked(self, linked: bool):
+        """Toggle live geometry callbacks depending on whether the node has connections."""
+        if linked == self._linked:
+            return
+        self._linked = linked
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, linked)
+
     def _canvas_from_scene(self):
         sc = self.scene()
         return sc.views()[0] if sc and sc.views() else None
@@ -347,8 +397,10 @@ class SelectableActuator(QGraphicsItem):
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
         if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
-            canvas = self._canvas or self._canvas_from_scene()
-            if canvas:
+            # Hot path (every drag step): use the back-reference the canvas sets on
+            # adoption instead of walking scene().views(). None once deleted.
+            canvas = self._canvas
+            if canvas is not None:
                 canvas.rebuild_all_lines()
                 canvas._emit_moved(self)
         return super().itemChange(change, value)
@@ -384,9 +436,15 @@ class ActuatorCanvas(QGraphicsView):
         super().__init__(parent)
         self.setObjectName("ActuatorCanvas")
         self._scene = QGraphicsScene(self)
+        # A chain tops out at a few hundred items: a linear scan beats keeping a BSP tree
+        # up to date on every add/move/remove.
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self._scene)
         self.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate)
+        # Items set their own pen/brush/font in paint(), no need to save/restore around them
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        # Preview ticks and selection flips dirty a handful of scattered nodes; repaint just those
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
         self.setFrameShape(QFrame.Shape.NoFrame)
         # Fill available space
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -541,6 +599,10 @@ class ActuatorCanvas(QGraphicsView):
 
     def mouseReleaseEvent(self, event):
         super().mouseReleaseEvent(event)
+        # Unlinked nodes don't send live geometry changes: report their move once here
+        for n in self.actuators.values():
+            if not n._linked and n.isSelected() and n.scenePos() != n._reported_pos:
+                self._emit_moved(n)
         self._emit_selection()
 
     def mouseDoubleClickEvent(self, event):
@@ -556,10 +618,12 @@ class ActuatorCanvas(QGraphicsView):
         self.selection_changed.emit(ids)
 
     def _emit_added(self, node: SelectableActuator):
-        self.actuator_added.emit(node.model.actuator_id, node.model.actuator_type, node.scenePos())
+        node._reported_pos = node.scenePos()
+        self.actuator_added.emit(node.model.actuator_id, node.model.actuator_type, node._reported_pos)
 
     def _emit_moved(self, node: SelectableActuator):
-        self.actuator_moved.emit(node.model.actuator_id, node.scenePos())
+        node._reported_pos = node.scenePos()
+        self.actuator_moved.emit(node.model.actuator_id, node._reported_pos)
 
     # ---- connections ----
     def rebuild_all_lines(self):
@@ -579,6 +643,9 @@ class ActuatorCanvas(QGraphicsView):
                 self._scene.addItem(line)
                 line.update_geometry()
                 self.connections.append(line)
+            # Only nodes with at least one line need live itemChange callbacks
+            for node in nodes:
+                node.set_linked(len(nodes) > 1)
 
     # ---- batch creation ----
     def create_chain(self, total: int = 6, rows: int = 1, cols: Optional[int] = None,
@@ -712,17 +779,34 @@ class CreateBranchDialog(QDialog):
         form.addRow(btns)
         btns.accepted.connect(self._on_accept)
         btns.rejected.connect(self.reject)
+        self._ok_btn = btns.button(QDialogButtonBox.StandardButton.Ok)
+        self._is_valid: Optional[bool] = None
 
         # Keep LRA default equal to total (so sum stays valid initially)
         self.total_spin.valueChanged.connect(self._sync_default_mix)
+        for spin in (self.total_spin, self.lra_spin, self.vca_spin, self.m_spin):
+            spin.valueChanged.connect(self._validate)
+        self._validate()
+
+    def _validate(self, *_):
+        # Spin arrows fire on every step: only touch the button when validity flips
+        ok = (self.lra_spin.value() + self.vca_spin.value() + self.m_spin.value()) <= self.total_spin.value()
+        if ok == self._is_valid:
+            return
+        self._is_valid = ok
+        self._ok_btn.setEnabled(ok)
+        self._ok_btn.setToolTip("" if ok else "LRA+VCA+M exceeds Total.")
 
     def _sync_default_mix(self, n: int):
         # Keep mix sane if user hasn't changed values (simple heuristic)
         current_sum = self.lra_spin.value() + self.vca_spin.value() + self.m_spin.value()
         if current_sum == 0 or self.lra_spin.value() == current_sum:  # default state
+            # total_spin's own _validate runs right after this slot, once, on the final mix
+            blockers = [QSignalBlocker(s) for s in (self.lra_spin, self.vca_spin, self.m_spin)]
             self.lra_spin.setValue(n)
             self.vca_spin.setValue(0)
             self.m_spin.setValue(0)
+            del blockers
 
     def _on_accept(self):
         total = self.total_spin.value()
@@ -844,6 +928,14 @@ class FlexibleActuatorSelector(QWidget):
             QMessageBox.critical(self, "Create Chain failed", str(e))
         
     
+    def set_selected_addresses(self, addrs):
+        """Select exactly the actuators whose ADDRESSES are in `addrs`, in one pass,
+        and emit selection_changed once for the whole update."""
+        targets = {int(i) for i in addrs}
+        for aid, node in self.canvas.actuators.items():
+            node.setSelected(id_to_addr(aid) in targets)
+        self.canvas._emit_selection()
+
     def set_preview_active(self, ids: List[int] | set[int]):
         """Highlight (ring) actuators whose ADDRESSES are in `ids`."""
         targets = {int(i) for i in ids}
@@ -861,14 +953,16 @@ class FlexibleActuatorSelector(QWidget):
 
     def _on_selection_changed(self, ids: List[str]):
         """Version avec log au lieu de status label"""
+        if not log.isEnabledFor(logging.DEBUG):
+            return
         if ids:
-            print(f"Selected: {', '.join(ids)}")
+            log.debug("Selected: %s", ", ".join(ids))
         else:
             total = len(self.canvas.actuators)
             if total:
-                print(f"{total} actuators — none selected")
+                log.debug("%d actuators — none selected", total)
             else:
-                print("No actuators — drag from palette or click Create Chain")
+                log.debug("No actuators — drag from palette or click Create Chain")
     
     def get_selected_actuators(self) -> List[int]:
         """Return selected actuator ADDRESSES (0..N) so the timeline can use them."""
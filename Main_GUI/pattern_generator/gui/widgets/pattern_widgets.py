@@ -5,7 +5,6 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
                            QLabel, QPushButton, QLineEdit, QListWidget,
                            QListWidgetItem, QTreeWidget, QTreeWidgetItem,
                            QMenu, QMessageBox, QAbstractItemView)
-from ..core.constants import PREMADE_PATTERNS
 
 class PatternVisualizationWidget(QWidget):
     """Clean library view with search, info panel, and primary actions."""
@@ -226,7 +225,7 @@ class PremadePatternPanel(QWidget):
 class UnifiedPatternLibraryWidget(QWidget):
     """
     Single Pattern Library view with two categories:
-      - Pre-made (from PREMADE_PATTERNS)
+      - Pre-made (from premade_patterns())
       - Custom (from PatternLibraryManager)
 
     Signals (unchanged):
@@ -374,11 +373,13 @@ class UnifiedPatternLibraryWidget(QWidget):
             kind, payload = sels[0]
             if kind == "premade":
                 p = payload; cfg = p.get("config", {})
+                # premade actuator sets are read-only numpy arrays: show them as a plain list
+                acts = [int(a) for a in cfg.get('actuators', ())]
                 lines = [
                     f"<b>{p.get('name','Preset')}</b>",
                     f"<i>{p.get('description','')}</i>" if p.get("description") else "",
                     f"<b>Type:</b> {cfg.get('pattern_type','?')}",
-                    f"<b>Actuators:</b> {cfg.get('actuators',[])}",
+                    f"<b>Actuators:</b> {acts}",
                     f"<b>Intensity:</b> {cfg.get('intensity','')}",
                     f"<b>Frequency:</b> {cfg.get('frequency','')}",
                 ]
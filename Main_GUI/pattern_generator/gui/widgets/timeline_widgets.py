@@ -2,6 +2,7 @@ import time
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
+import numpy as np
 from PyQt6.QtCore import (
     QObject, pyqtSignal, Qt, QTimer, QSize, QRectF, QPointF
 )
@@ -15,7 +16,7 @@ from PyQt6.QtWidgets import (
     QSizePolicy, QMessageBox, QInputDialog
 )
 
-from ..core.data_models import TimelineClip
+from ..core.data_models import ClipTable, TimelineClip
 from ..utils.workers import TimelineDeviceWorker
 
 if TYPE_CHECKING:
@@ -29,15 +30,19 @@ class TimelineModel(QObject):
 
     def __init__(self):
         super().__init__()
-        self._clips: list[TimelineClip] = []
-        self._selected: Optional[TimelineClip] = None
+        self._table = ClipTable()
+        self._selected_id: Optional[int] = None
+
+    def table(self) -> ClipTable:
+        """Column storage, for batch passes (painting, playback)."""
+        return self._table
 
     def clips(self) -> list[TimelineClip]:
-        return list(self._clips)
+        return self._table.views()
 
     def clear(self):
-        self._clips.clear()
-        self._selected = None
+        self._table.clear()
+        self._selected_id = None
         self.changed.emit()
 
     def add_clip_for_actuators(self, actuators: list[int],
@@ -46,40 +51,38 @@ class TimelineModel(QObject):
                                start_s: float, end_s: float):
         start_s = max(0.0, float(start_s))
         end_s   = max(start_s, float(end_s))
-        for a in sorted(set(int(x) for x in actuators)):
-            self._clips.append(TimelineClip(a, start_s, end_s, waveform_name, event))
+        self._table.extend(np.unique(np.asarray(actuators, dtype=int)), start_s, end_s, waveform_name, event)
         self.changed.emit()
 
     def remove_clip(self, clip: TimelineClip):
-        try:
-            self._clips.remove(clip)
-        except ValueError:
-            pass
-        if self._selected is clip:
-            self._selected = None
+        row = self._table.row_of(clip.clip_id)
+        if row >= 0:
+            self._table.remove(row)
+        if self._selected_id == clip.clip_id:
+            self._selected_id = None
         self.changed.emit()
 
     def set_selected(self, clip: Optional[TimelineClip]):
-        self._selected = clip
+        self._selected_id = clip.clip_id if clip else None
         self.changed.emit()
 
     def selected(self) -> Optional[TimelineClip]:
-        return self._selected
+        if self._selected_id is None:
+            return None
+        row = self._table.row_of(self._selected_id)
+        return self._table.view(row) if row >= 0 else None
 
     def total_duration(self) -> float:
-        if not self._clips: return 0.0
-        return max((c.end_s for c in self._clips), default=0.0)
+        return self._table.total_duration()
 
     def actuators(self) -> list[int]:
-        return sorted({c.actuator for c in self._clips})
+        return self._table.actuators()
 
     # Preview helper: who is active at time t?
     def active_actuators_at(self, t_s: float) -> list[int]:
-        out = []
-        for c in self._clips:
-            if c.start_s <= t_s <= c.end_s:
-                out.append(c.actuator)
-        return sorted(set(out))
+        t = self._table
+        # Same plain-set form as ClipTable.actuators(), which keeps numpy.ma unloaded
+        return sorted(set(t.actuator[t.active_at(t_s)].tolist()))
 
 
 class TimelineView(QWidget):
@@ -157,28 +160,34 @@ class TimelineView(QWidget):
             p.setPen(QPen(QColor("#D1D5DB")))
             p.drawLine(self._margin_l, y + self._row_h, self.width() - 8, y + self._row_h)
 
-        # Clips
+        # Clips, culled to the repainted rows and time window (clip rects are at least 12 px wide)
         sel = self._model.selected()
-        for clip in self._model.clips():
-            try:
-                ri = rows.index(clip.actuator)
-            except ValueError:
-                continue
-            y = base_y + ri * (self._row_h + self._row_gap)
-            x0 = self._margin_l + int(clip.start_s * self._px_per_second)
-            x1 = self._margin_l + int(clip.end_s   * self._px_per_second)
-            rect = QRectF(x0, y, max(12, x1 - x0), self._row_h)
-            # fill
-            p.setPen(QPen(QColor("#3B82F6"), 1))
-            p.setBrush(QBrush(QColor("#93C5FD")))
-            if sel is clip:
-                p.setBrush(QBrush(QColor("#60A5FA")))
-                p.setPen(QPen(QColor("#1D4ED8"), 2))
-            p.drawRoundedRect(rect, 6, 6)
-            # text
-            p.setPen(QPen(QColor("#111827")))
-            name = clip.waveform_name or "waveform"
-            p.drawText(rect.adjusted(6, 0, -4, 0), Qt.AlignmentFlag.AlignVCenter, f"{name} ({clip.start_s:.1f}–{clip.end_s:.1f}s)")
+        sel_id = sel.clip_id if sel else None
+        table = self._model.table()
+        pitch = self._row_h + self._row_gap
+        first_ri = max(0, int((e.rect().top() - base_y) // pitch))
+        last_ri = min(len(rows) - 1, int((e.rect().bottom() - base_y) // pitch))
+        t0 = (e.rect().left() - self._margin_l - 12) / self._px_per_second
+        t1 = (e.rect().right() - self._margin_l) / self._px_per_second
+        for ri in range(first_ri, last_ri + 1):
+            y = base_y + ri * pitch
+            vis = table.rows_for_actuator(rows[ri], t0, t1)
+            for r, cid, start_s, end_s in zip(vis.tolist(), table.ids[vis].tolist(),
+                                              table.start_s[vis].tolist(), table.end_s[vis].tolist()):
+                x0 = self._margin_l + int(start_s * self._px_per_second)
+                x1 = self._margin_l + int(end_s   * self._px_per_second)
+                rect = QRectF(x0, y, max(12, x1 - x0), self._row_h)
+                # fill
+                p.setPen(QPen(QColor("#3B82F6"), 1))
+                p.setBrush(QBrush(QColor("#93C5FD")))
+                if cid == sel_id:
+                    p.setBrush(QBrush(QColor("#60A5FA")))
+                    p.setPen(QPen(QColor("#1D4ED8"), 2))
+                p.drawRoundedRect(rect, 6, 6)
+                # text
+                p.setPen(QPen(QColor("#111827")))
+                name = table.waveform_name(r) or "waveform"
+                p.drawText(rect.adjusted(6, 0, -4, 0), Qt.AlignmentFlag.AlignVCenter, f"{name} ({start_s:.1f}–{end_s:.1f}s)")
 
         # Playhead
         x_cursor = self._margin_l + int(self._cursor_t * self._px_per_second)
@@ -190,18 +199,24 @@ class TimelineView(QWidget):
     def _hit_test(self, pos: QPointF) -> Optional[TimelineClip]:
         rows = self._rows_layout()
         base_y = 24
-        for clip in self._model.clips():
-            try:
-                ri = rows.index(clip.actuator)
-            except ValueError:
-                continue
-            y = base_y + ri * (self._row_h + self._row_gap)
-            x0 = self._margin_l + int(clip.start_s * self._px_per_second)
-            x1 = self._margin_l + int(clip.end_s   * self._px_per_second)
-            rect = QRectF(x0, y, max(12, x1 - x0), self._row_h)
-            if rect.contains(pos):
-                return clip
-        return None
+        # The y position picks the actuator row; then test that row's clips in one pass
+        ri = int((pos.y() - base_y) // (self._row_h + self._row_gap))
+        if not 0 <= ri < len(rows):
+            return None
+        y = base_y + ri * (self._row_h + self._row_gap)
+        if pos.y() > y + self._row_h:
+            return None
+        table = self._model.table()
+        # Only this actuator's clips near the click (padded for the 12 px minimum width)
+        t = (pos.x() - self._margin_l) / self._px_per_second
+        pad = 13 / self._px_per_second
+        cand = table.rows_for_actuator(rows[ri], t - pad, t + pad)
+        x0 = self._margin_l + (table.start_s[cand] * self._px_per_second).astype(np.int64)
+        x1 = self._margin_l + (table.end_s[cand]   * self._px_per_second).astype(np.int64)
+        width = np.maximum(12, x1 - x0)
+        hits = cand[(x0 <= pos.x()) & (pos.x() <= x0 + width)]
+        # Earliest-added clip wins on overlap
+        return table.view(int(hits.min())) if len(hits) else None
 
     def mousePressEvent(self, e):
         if e.button() == Qt.MouseButton.LeftButton:
@@ -212,6 +227,8 @@ class TimelineView(QWidget):
 
 class TimelinePanel(QWidget):
     """Compact panel placed UNDER the tabs; drives the Designer canvas."""
+    _EXPANDING = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
     def __init__(self, gui: 'HapticPatternGUI'):
         super().__init__(gui)
         self.gui = gui
@@ -249,16 +266,13 @@ class TimelinePanel(QWidget):
 
         # Title label
         title_lbl = QLabel("Timeline")
-        title_lbl.setStyleSheet("font-weight:600; font-size:11px;")
-        title_lbl.setStyleSheet("font-weight:600;")
+        title_lbl.setObjectName("TimelineTitle")
         title_row.addWidget(title_lbl)
 
         # Control spinboxes
         title_row.addWidget(QLabel("Start:"))
         self.startSpin = QDoubleSpinBox()
         self.startSpin.setFixedHeight(27)
-        self.startSpin.setStyleSheet("font-size:10px; padding:0 4px;")
-        self.startSpin.setMaximumWidth(72)
         self.startSpin.setRange(0.0, 3600.0)
         self.startSpin.setDecimals(2)
         self.startSpin.setSuffix(" s")
@@ -269,8 +283,6 @@ class TimelinePanel(QWidget):
         title_row.addWidget(QLabel("Stop:"))
         self.endSpin = QDoubleSpinBox()
         self.endSpin.setFixedHeight(27)
-        self.endSpin.setStyleSheet("font-size:10px; padding:0 4px;")
-        self.endSpin.setMaximumWidth(72)
         self.endSpin.setRange(0.0, 3600.0)
         self.endSpin.setDecimals(2) 
         self.endSpin.setSuffix(" s")
@@ -313,12 +325,19 @@ class TimelinePanel(QWidget):
         for b in (self.btnAdd, self.btnRemove, self.btnClear,
                 self.btnPreview, self.btnDevice, self.btnStop, self.btnSave):
             b.setFixedHeight(22)
-            b.setStyleSheet("font-size:10px; padding:0 6px; margin-right:6px;")
+
+        # Title-row controls are direct children of the panel: style them in one pass
+        self.setObjectName("TimelinePanel")
+        self.setStyleSheet("""
+            QLabel#TimelineTitle { font-weight:600; }
+            #TimelinePanel > QDoubleSpinBox { font-size:10px; padding:0 4px; }
+            #TimelinePanel > QPushButton { font-size:10px; padding:0 6px; margin-right:6px; }
+        """)
 
         # ───────────────────────────────── Timeline view  
         view_wrap = QFrame()
         view_wrap.setObjectName("TimelineViewWrap")
-        view_wrap.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        view_wrap.setSizePolicy(self._EXPANDING)
         view_wrap.setFrameShape(QFrame.Shape.NoFrame)
         vlay = QVBoxLayout(view_wrap)
         vlay.setContentsMargins(0, 0, 0, 0)
@@ -332,9 +351,9 @@ class TimelinePanel(QWidget):
 
 
 
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setSizePolicy(self._EXPANDING)
         # Let the viewport and its wrapper grow with the panel
-        self.view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.view.setSizePolicy(self._EXPANDING)
 
         # ───────────────────────────────── Wiring#  
         # # Default zoom and keyboard shortcuts (Cmd+ / Cmd− map to ZoomIn/ZoomOut)
@@ -17,24 +17,9 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 def main():
-    try:
-        # Try the new import path first
-        from gui.core.main_gui import main as gui_main
-        gui_main()
-    except ImportError:
-        try:
-            # Fallback to old import
-            from gui.main_gui import main as gui_main
-            gui_main()
-        except ImportError:
-            try:
-                # Last resort fallback
-                from main_gui import main as gui_main
-                gui_main()
-            except ImportError as e:
-                print(f"Error: Could not import main GUI module: {e}")
-                print("Please ensure the GUI modules are properly installed.")
-                sys.exit(1)
+    # Same single entry point as Main_GUI/main.py
+    from gui.core.main_gui import main as gui_main
+    gui_main()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
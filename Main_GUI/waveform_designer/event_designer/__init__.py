@@ -3,6 +3,13 @@
 Event Designer module for haptic waveform creation and editing.
 """
 
-from .main import UniversalEventDesigner
+__all__ = ["UniversalEventDesigner"]
 
-__all__ = ["UniversalEventDesigner"]
\ No newline at end of file
+
+def __getattr__(name: str):
+    # The designer window is imported on first use, so importing the core
+    # data model (e.g. from the pattern generator) doesn't load its whole UI
+    if name == "UniversalEventDesigner":
+        from .main import UniversalEventDesigner
+        return UniversalEventDesigner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
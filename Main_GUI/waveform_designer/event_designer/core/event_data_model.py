@@ -20,8 +20,8 @@ from enum import Enum
 from typing import Dict, List, Optional, Any, Tuple
 
 import numpy as np
-from scipy import signal  # waveforms (square/saw/chirp, etc.)
-from scipy.signal import resample_poly  # high-quality resampling
+# scipy.signal (square/saw/chirp, polyphase resampling) is imported inside the
+# generators that need it: it dominates import time and most callers never use it
 
 
 # -----------------------------------------------------------------------------
@@ -50,6 +50,7 @@ def resample_to(y: np.ndarray, sr_in: float, sr_out: float) -> np.ndarray:
     up = int(round(sr_out))
     down = int(round(sr_in))
     from math import gcd
+    from scipy.signal import resample_poly  # high-quality resampling
     g = gcd(up, down) or 1
     return resample_poly(y, up // g, down // g).astype(float, copy=False)
 
@@ -99,6 +100,7 @@ def generate_builtin_waveform(
     Lightweight numeric generator used by Waveform Studio for preview and DnD.
     Returns (t, y, sr). Side-effect free, does not allocate a HapticEvent.
     """
+    from scipy import signal  # waveforms (square/saw/chirp, etc.)
     t = common_time_grid(duration, sample_rate)
     k = (kind or "Sine").lower()
 
@@ -295,6 +297,7 @@ class HapticEvent:
         Build a HapticEvent containing one of the eight standard oscillators:
         Sine, Square, Saw, Triangle, Chirp, FM, PWM, Noise.
         """
+        from scipy import signal  # waveforms (square/saw/chirp, etc.)
         t = common_time_grid(duration, sample_rate)
 
         if   osc_type == "Sine":
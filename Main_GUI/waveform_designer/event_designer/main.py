@@ -48,6 +48,7 @@ class UniversalEventDesigner(QMainWindow):
         self.logs_visible = True
         self.export_watch_dir: str | None = None
         self.export_start_mtime: float = 0.0
+        self.library_widget: EventLibraryWidget | None = None  # installed after first paint
         
         # File system watcher for Meta Haptics Studio integration
         self.dir_watcher = QFileSystemWatcher(self)
@@ -311,14 +312,34 @@ class UniversalEventDesigner(QMainWindow):
 
         tabs.addTab(scroll, "Waveform Design")
 
-        # Library tab
+        # Library tab: placeholder now, real widget once the event loop is idle
+        # (building it scans the library folders on disk)
+        self._left_tabs = tabs
+        self._library_placeholder = QLabel("Loading library…")
+        self._library_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        tabs.addTab(self._library_placeholder, "Waveform Library")
+        QTimer.singleShot(0, self._install_library_widget)
+        
+        return tabs
+
+    def _install_library_widget(self):
+        """Build the Waveform Library widget and swap it in for the placeholder."""
         self.library_widget = EventLibraryWidget()
         self.library_widget.event_selected.connect(
             lambda payload: self.handle_library_payload(payload, compose=False)
         )
-        tabs.addTab(self.library_widget, "Waveform Library")
-        
-        return tabs
+        tabs = self._left_tabs
+        idx = tabs.indexOf(self._library_placeholder)
+        current = tabs.currentIndex()
+        tabs.setUpdatesEnabled(False)
+        try:
+            tabs.removeTab(idx)
+            tabs.insertTab(idx, self.library_widget, "Waveform Library")
+            tabs.setCurrentIndex(current)
+        finally:
+            tabs.setUpdatesEnabled(True)
+        self._library_placeholder.deleteLater()
+        self._library_placeholder = None
 
     def _build_metadata_widget(self) -> QWidget:
         """Build the metadata editing widget."""
@@ -436,8 +457,9 @@ class UniversalEventDesigner(QMainWindow):
                     self._handle_file_payload(payload.get("path"), compose=compose)
                     return
             elif isinstance(payload, str):
-                if payload.startswith("oscillator::"):
-                    self._handle_oscillator_payload(payload.split("::", 1)[1], compose=compose)
+                head, sep, tail = payload.partition("::")
+                if sep and head == "oscillator":
+                    self._handle_oscillator_payload(tail, compose=compose)
                 else:
                     self._handle_file_payload(payload, compose=compose)
         except Exception as e:
@@ -640,9 +662,8 @@ class UniversalEventDesigner(QMainWindow):
         if self.current_file_path:
             if self.current_event.save_to_file(self.current_file_path):
                 self.log_info_message(f"Saved: {os.path.basename(self.current_file_path)}")
-                if hasattr(self, "library_widget"):
-                    if hasattr(self.library_widget, "refresh"): 
-                        self.library_widget.refresh()
+                if self.library_widget is not None:
+                    self.library_widget.refresh()
             else: 
                 QMessageBox.critical(self, "Error", "Save failed")
         else:
@@ -677,9 +698,8 @@ class UniversalEventDesigner(QMainWindow):
                 except Exception as e: 
                     self.log_info_message(f"Failed to copy into library/customized: {e}")
             
-            if hasattr(self, "library_widget"):
-                if hasattr(self.library_widget, "refresh"): 
-                    self.library_widget.refresh()
+            if self.library_widget is not None:
+                self.library_widget.refresh()
         else:
             QMessageBox.critical(self, "Error", "Save failed")
 
@@ -0,0 +1,161 @@
+# Form implementation generated from reading ui file 'waveform_editor.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_WaveformEditorWidget(object):
+    def setupUi(self, WaveformEditorWidget):
+        WaveformEditorWidget.setObjectName("WaveformEditorWidget")
+        WaveformEditorWidget.resize(1200, 800)
+        self.main_layout = QtWidgets.QVBoxLayout(WaveformEditorWidget)
+        self.main_layout.setSpacing(5)
+        self.main_layout.setObjectName("main_layout")
+        self.plot_container = QtWidgets.QWidget(parent=WaveformEditorWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(3)
+        sizePolicy.setHeightForWidth(self.plot_container.sizePolicy().hasHeightForWidth())
+        self.plot_container.setSizePolicy(sizePolicy)
+        self.plot_container.setObjectName("plot_container")
+        self.plot_layout = QtWidgets.QVBoxLayout(self.plot_container)
+        self.plot_layout.setContentsMargins(0, 0, 0, 0)
+        self.plot_layout.setObjectName("plot_layout")
+        self.main_layout.addWidget(self.plot_container)
+        self.controls_container = QtWidgets.QWidget(parent=WaveformEditorWidget)
+        self.controls_container.setObjectName("controls_container")
+        self.controls_layout = QtWidgets.QHBoxLayout(self.controls_container)
+        self.controls_layout.setObjectName("controls_layout")
+        self.amplitude_group = QtWidgets.QGroupBox(parent=self.controls_container)
+        self.amplitude_group.setObjectName("amplitude_group")
+        self.amplitude_grid = QtWidgets.QGridLayout(self.amplitude_group)
+        self.amplitude_grid.setObjectName("amplitude_grid")
+        self.intensity_label = QtWidgets.QLabel(parent=self.amplitude_group)
+        self.intensity_label.setObjectName("intensity_label")
+        self.amplitude_grid.addWidget(self.intensity_label, 0, 0, 1, 1)
+        self.intensity_spinbox = QtWidgets.QDoubleSpinBox(parent=self.amplitude_group)
+        self.intensity_spinbox.setMinimum(0.1)
+        self.intensity_spinbox.setMaximum(3.0)
+        self.intensity_spinbox.setSingleStep(0.05)
+        self.intensity_spinbox.setProperty("value", 1.0)
+        self.intensity_spinbox.setObjectName("intensity_spinbox")
+        self.amplitude_grid.addWidget(self.intensity_spinbox, 0, 1, 1, 1)
+        self.offset_label = QtWidgets.QLabel(parent=self.amplitude_group)
+        self.offset_label.setObjectName("offset_label")
+        self.amplitude_grid.addWidget(self.offset_label, 1, 0, 1, 1)
+        self.offset_spinbox = QtWidgets.QDoubleSpinBox(parent=self.amplitude_group)
+        self.offset_spinbox.setMinimum(-1.0)
+        self.offset_spinbox.setMaximum(1.0)
+        self.offset_spinbox.setSingleStep(0.05)
+        self.offset_spinbox.setProperty("value", 0.0)
+        self.offset_spinbox.setObjectName("offset_spinbox")
+        self.amplitude_grid.addWidget(self.offset_spinbox, 1, 1, 1, 1)
+        self.controls_layout.addWidget(self.amplitude_group)
+        self.timing_group = QtWidgets.QGroupBox(parent=self.controls_container)
+        self.timing_group.setObjectName("timing_group")
+        self.timing_grid = QtWidgets.QGridLayout(self.timing_group)
+        self.timing_grid.setObjectName("timing_grid")
+        self.duration_label = QtWidgets.QLabel(parent=self.timing_group)
+        self.duration_label.setObjectName("duration_label")
+        self.timing_grid.addWidget(self.duration_label, 0, 0, 1, 1)
+        self.duration_spinbox = QtWidgets.QDoubleSpinBox(parent=self.timing_group)
+        self.duration_spinbox.setMinimum(0.25)
+        self.duration_spinbox.setMaximum(4.0)
+        self.duration_spinbox.setSingleStep(0.05)
+        self.duration_spinbox.setProperty("value", 1.0)
+        self.duration_spinbox.setObjectName("duration_spinbox")
+        self.timing_grid.addWidget(self.duration_spinbox, 0, 1, 1, 1)
+        self.freq_shift_label = QtWidgets.QLabel(parent=self.timing_group)
+        self.freq_shift_label.setObjectName("freq_shift_label")
+        self.timing_grid.addWidget(self.freq_shift_label, 1, 0, 1, 1)
+        self.freq_shift_spinbox = QtWidgets.QDoubleSpinBox(parent=self.timing_group)
+        self.freq_shift_spinbox.setMinimum(-1.0)
+        self.freq_shift_spinbox.setMaximum(1.0)
+        self.freq_shift_spinbox.setSingleStep(0.05)
+        self.freq_shift_spinbox.setProperty("value", 0.0)
+        self.freq_shift_spinbox.setObjectName("freq_shift_spinbox")
+        self.timing_grid.addWidget(self.freq_shift_spinbox, 1, 1, 1, 1)
+        self.controls_layout.addWidget(self.timing_group)
+        self.adsr_group = QtWidgets.QGroupBox(parent=self.controls_container)
+        self.adsr_group.setObjectName("adsr_group")
+        self.adsr_grid = QtWidgets.QGridLayout(self.adsr_group)
+        self.adsr_grid.setObjectName("adsr_grid")
+        self.attack_label = QtWidgets.QLabel(parent=self.adsr_group)
+        self.attack_label.setObjectName("attack_label")
+        self.adsr_grid.addWidget(self.attack_label, 0, 0, 1, 1)
+        self.attack_spinbox = QtWidgets.QDoubleSpinBox(parent=self.adsr_group)
+        self.attack_spinbox.setMinimum(0.0)
+        self.attack_spinbox.setMaximum(2.0)
+        self.attack_spinbox.setSingleStep(0.05)
+        self.attack_spinbox.setProperty("value", 0.0)
+        self.attack_spinbox.setObjectName("attack_spinbox")
+        self.adsr_grid.addWidget(self.attack_spinbox, 0, 1, 1, 1)
+        self.decay_label = QtWidgets.QLabel(parent=self.adsr_group)
+        self.decay_label.setObjectName("decay_label")
+        self.adsr_grid.addWidget(self.decay_label, 0, 2, 1, 1)
+        self.decay_spinbox = QtWidgets.QDoubleSpinBox(parent=self.adsr_group)
+        self.decay_spinbox.setMinimum(0.0)
+        self.decay_spinbox.setMaximum(2.0)
+        self.decay_spinbox.setSingleStep(0.05)
+        self.decay_spinbox.setProperty("value", 0.0)
+        self.decay_spinbox.setObjectName("decay_spinbox")
+        self.adsr_grid.addWidget(self.decay_spinbox, 0, 3, 1, 1)
+        self.sustain_label = QtWidgets.QLabel(parent=self.adsr_group)
+        self.sustain_label.setObjectName("sustain_label")
+        self.adsr_grid.addWidget(self.sustain_label, 1, 0, 1, 1)
+        self.sustain_spinbox = QtWidgets.QDoubleSpinBox(parent=self.adsr_group)
+        self.sustain_spinbox.setMinimum(0.0)
+        self.sustain_spinbox.setMaximum(1.0)
+        self.sustain_spinbox.setSingleStep(0.05)
+        self.sustain_spinbox.setProperty("value", 1.0)
+        self.sustain_spinbox.setObjectName("sustain_spinbox")
+        self.adsr_grid.addWidget(self.sustain_spinbox, 1, 1, 1, 1)
+        self.release_label = QtWidgets.QLabel(parent=self.adsr_group)
+        self.release_label.setObjectName("release_label")
+        self.adsr_grid.addWidget(self.release_label, 1, 2, 1, 1)
+        self.release_spinbox = QtWidgets.QDoubleSpinBox(parent=self.adsr_group)
+        self.release_spinbox.setMinimum(0.0)
+        self.release_spinbox.setMaximum(2.0)
+        self.release_spinbox.setSingleStep(0.05)
+        self.release_spinbox.setProperty("value", 0.0)
+        self.release_spinbox.setObjectName("release_spinbox")
+        self.adsr_grid.addWidget(self.release_spinbox, 1, 3, 1, 1)
+        self.controls_layout.addWidget(self.adsr_group)
+        self.reset_group = QtWidgets.QGroupBox(parent=self.controls_container)
+        self.reset_group.setObjectName("reset_group")
+        self.reset_layout = QtWidgets.QVBoxLayout(self.reset_group)
+        self.reset_layout.setObjectName("reset_layout")
+        self.reset_button = QtWidgets.QPushButton(parent=self.reset_group)
+        self.reset_button.setObjectName("reset_button")
+        self.reset_layout.addWidget(self.reset_button)
+        self.play_button = QtWidgets.QPushButton(parent=self.reset_group)
+        self.play_button.setObjectName("play_button")
+        self.reset_layout.addWidget(self.play_button)
+        self.controls_layout.addWidget(self.reset_group)
+        self.main_layout.addWidget(self.controls_container)
+
+        self.retranslateUi(WaveformEditorWidget)
+        QtCore.QMetaObject.connectSlotsByName(WaveformEditorWidget)
+
+    def retranslateUi(self, WaveformEditorWidget):
+        _translate = QtCore.QCoreApplication.translate
+        WaveformEditorWidget.setWindowTitle(_translate("WaveformEditorWidget", "Waveform Editor"))
+        self.amplitude_group.setTitle(_translate("WaveformEditorWidget", "Amplitude"))
+        self.intensity_label.setText(_translate("WaveformEditorWidget", "Intensity ×:"))
+        self.offset_label.setText(_translate("WaveformEditorWidget", "Offset:"))
+        self.timing_group.setTitle(_translate("WaveformEditorWidget", "Timing"))
+        self.duration_label.setText(_translate("WaveformEditorWidget", "Duration ×:"))
+        self.freq_shift_label.setText(_translate("WaveformEditorWidget", "Freq shift:"))
+        self.adsr_group.setTitle(_translate("WaveformEditorWidget", "Envelope (ADSR)"))
+        self.attack_label.setText(_translate("WaveformEditorWidget", "Attack:"))
+        self.decay_label.setText(_translate("WaveformEditorWidget", "Decay:"))
+        self.sustain_label.setText(_translate("WaveformEditorWidget", "Sustain:"))
+        self.release_label.setText(_translate("WaveformEditorWidget", "Release:"))
+        self.reset_group.setTitle(_translate("WaveformEditorWidget", "Reset"))
+        self.reset_button.setText(_translate("WaveformEditorWidget", "Reset Parameters"))
+        self.play_button.setText(_translate("WaveformEditorWidget", "▶ Play Waveform"))
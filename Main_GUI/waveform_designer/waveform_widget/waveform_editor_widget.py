@@ -7,8 +7,7 @@ import os, json, typing as t
 import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QPushButton, QButtonGroup
-from PyQt6 import uic
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QFormLayout, QDialog,
@@ -22,6 +21,8 @@ from ..event_designer.core.event_data_model import (
     HapticEvent, EventCategory, WaveformData, ParameterModifications,
     ActuatorMapping, ActuatorPattern, EventMetadata,
 )
+# Generated from waveform_editor.ui: pyuic6 waveform_editor.ui -o waveform_editor_ui.py
+from .waveform_editor_ui import Ui_WaveformEditorWidget
 
 # --------------------------------------------------------------------------
 # Parameter dialogs (used when the user drops an oscillator)
@@ -228,7 +229,7 @@ class _EditableScatter(pg.ScatterPlotItem):
 # --------------------------------------------------------------------------
 # Main widget (graph-only canvas)
 # --------------------------------------------------------------------------
-class WaveformEditorWidget(QWidget):
+class WaveformEditorWidget(QWidget, Ui_WaveformEditorWidget):
     parameters_changed = pyqtSignal()
     device_test_requested = pyqtSignal(int)  # main window will emit this from the Device menu
     _X_PAD = 0.02      # 2% of duration
@@ -259,12 +260,19 @@ class WaveformEditorWidget(QWidget):
         self._setup_dual_axes_and_curves()
         self._amp_scatter: _EditableScatter | None = None
         self._freq_scatter: _EditableScatter | None = None
+        # Original (unmodified) curves only change when the point lists are replaced,
+        # so parameter tweaks can reuse their arrays and display resampling.
+        self._org_cache: dict[str, tuple] = {}
 
-        # Hide all canvas controls
-        self._hide_header_controls()
         self._ensure_parameter_cards_visible()
         self._connect_spinboxes()
 
+        # Coalesce spinbox-driven replots into at most one per frame
+        self._replot_timer = QTimer(self)
+        self._replot_timer.setSingleShot(True)
+        self._replot_timer.setInterval(16)
+        self._replot_timer.timeout.connect(self._do_replot)
+
         # Default view mode (changed via menubar -> set_view_mode)
         self._view_mode = "Amplitude"
 
@@ -449,8 +457,8 @@ class WaveformEditorWidget(QWidget):
 
     # ---- UI / Plot setup ---------------------------------------------------
     def _load_ui(self):
-        ui_path = os.path.join(os.path.dirname(__file__), "waveform_editor.ui")
-        uic.loadUi(ui_path, self)
+        # Pre-compiled form: no XML parsing per instance
+        self.setupUi(self)
 
     def _setup_plot_widget(self):
         """Create the PyQtGraph plot and insert into the .ui placeholder."""
@@ -540,33 +548,19 @@ class WaveformEditorWidget(QWidget):
             self.pan_slider.setEnabled(leftmax > 1e-9)
 
     def _on_zoom_changed(self, val: int):
-        self._zoom_frac = self._window_frac_from_zoom_val(val)
+        frac = self._window_frac_from_zoom_val(val)
+        if frac == self._zoom_frac:
+            return
+        self._zoom_frac = frac
         self._apply_x_from_state()
 
     def _on_pan_changed(self, val: int):
-        self._scroll_frac = float(val) / float(self.pan_slider.maximum() or 1)
+        frac = float(val) / float(self.pan_slider.maximum() or 1)
+        if frac == self._scroll_frac:
+            return
+        self._scroll_frac = frac
         self._apply_x_from_state()
 
-    def _hide_header_controls(self):
-        """
-        Hide any header/tool rows that might still be in the .ui (old graph selector, etc.),
-        but DO NOT hide the parameter group boxes under the plot.
-        """
-        to_hide = [
-            "graph_selector",          # old combo
-            "graph_selector_widget",   # container that includes the 'View:' label
-            "view_label",              # label inside the old header
-            "toolbarWidget",
-            "topBar",
-            "controlsRow",
-        ]
-        for name in to_hide:
-            if hasattr(self, name):
-                try:
-                    getattr(self, name).setVisible(False)
-                except Exception:
-                    pass
-    
     def _ensure_parameter_cards_visible(self):
             """
             Make sure the parameter group boxes under the plot are visible again.
@@ -584,12 +578,21 @@ class WaveformEditorWidget(QWidget):
                         pass
         
     def _set_param(self, name: str, value: float):
-        """Update a ParameterModifications field, re-render, and notify listeners."""
+        """Update a ParameterModifications field, notify listeners, and schedule a re-render."""
         if not self.current_event:
             return
-        setattr(self.current_event.parameter_modifications, name, float(value))
+        mods = self.current_event.parameter_modifications
+        value = float(value)
+        if getattr(mods, name, None) == value:
+            return  # duplicate emission: nothing to notify or redraw
+        setattr(mods, name, value)
         self.parameters_changed.emit()
-        self.plot_event(self.current_event)
+        self._replot_timer.start()
+
+    def _do_replot(self):
+        """Timer slot: redraw once after a burst of parameter changes."""
+        if self.current_event:
+            self.plot_event(self.current_event)
 
     def _connect_spinboxes(self):
         """Connect parameter cards (under the plot) to the live model if present in the .ui."""
@@ -840,6 +843,7 @@ class WaveformEditorWidget(QWidget):
     # ---- Public API --------------------------------------------------------
     def set_event(self, evt: HapticEvent):
         self.current_event = evt
+        self._org_cache.clear()
         self._sync_spinboxes_from_params()
         self.plot_event(evt)
 
@@ -855,6 +859,18 @@ class WaveformEditorWidget(QWidget):
         for it in (self.curve_freq_org, self.curve_freq_mod): it.setVisible(show_freq)
         self.plot_widget.getPlotItem().getAxis('right').setVisible(show_freq)
 
+    def _original_curve(self, kind: str, pts: list, key: str, target_points: int, name: str):
+        """(t, y, t_disp, y_disp) for an original point list, cached while the list object is unchanged."""
+        hit = self._org_cache.get(kind)
+        if hit is not None and hit[0] is pts and hit[1] == name:
+            return hit[2:]
+        t = np.asarray([pt["time"] for pt in pts], dtype=float)
+        y = np.asarray([pt[key] for pt in pts], dtype=float)
+        t_disp, y_disp = create_faithful_display_signal(t, y, target_points=target_points, signal_name=name)
+        # Keep a reference to pts so its identity cannot be recycled while cached
+        self._org_cache[kind] = (pts, name, t, y, t_disp, y_disp)
+        return t, y, t_disp, y_disp
+
     def _set_curve_data(self, curve, x, y):
         try:
             curve.setData(x, y, downsampleMethod='peak')
@@ -889,10 +905,7 @@ class WaveformEditorWidget(QWidget):
 
         # ---------- Amplitude ----------
         if wf.amplitude:
-            t_a  = np.asarray([pt["time"] for pt in wf.amplitude], dtype=float)
-            a    = np.asarray([pt["amplitude"] for pt in wf.amplitude], dtype=float)
-
-            t_disp, a_disp = create_faithful_display_signal(t_a, a, target_points=2000, signal_name=name)
+            t_a, a, t_disp, a_disp = self._original_curve("amp", wf.amplitude, "amplitude", 2000, name)
             self._set_curve_data(self.curve_amp_org, t_disp, a_disp)
 
             a_mod = event.get_modified_waveform()
@@ -920,10 +933,7 @@ class WaveformEditorWidget(QWidget):
 
         # ---------- Frequency ----------
         if wf.frequency:
-            t_f = np.asarray([pt["time"] for pt in wf.frequency], dtype=float)
-            f   = np.asarray([pt["frequency"] for pt in wf.frequency], dtype=float)
-
-            tfd, fd = create_faithful_display_signal(t_f, f, target_points=1200, signal_name=name)
+            t_f, f, tfd, fd = self._original_curve("freq", wf.frequency, "frequency", 1200, name)
             self._set_curve_data(self.curve_freq_org, tfd, fd)
 
             f_mod = event.get_modified_frequency()